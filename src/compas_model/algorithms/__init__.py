@@ -1,5 +1,10 @@
 from .collisions import is_aabb_aabb_collision
+from .collisions import get_aabb_collision_pairs
+from .collisions import get_aabb_collision_pairs_numpy
+from .collisions import aabbs_to_numpy
 from .collisions import is_box_box_collision
+from .collisions import is_box_box_collision_batch
+from .collisions import obbs_to_numpy
 from .collisions import is_face_to_face_collision
 from .collisions import get_collision_pairs
 
@@ -8,7 +13,12 @@ from .interfaces import blockmodel_interfaces
 
 __all__ = [
     "is_aabb_aabb_collision",
+    "get_aabb_collision_pairs",
+    "get_aabb_collision_pairs_numpy",
+    "aabbs_to_numpy",
     "is_box_box_collision",
+    "is_box_box_collision_batch",
+    "obbs_to_numpy",
     "is_face_to_face_collision",
     "get_collision_pairs",
     "blockmodel_interfaces",
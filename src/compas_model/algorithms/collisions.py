@@ -1,4 +1,9 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from math import asin
 from math import fabs
+from math import floor
+from math import sin
 
 from compas.geometry import Frame
 from compas.geometry import Plane
@@ -7,6 +12,16 @@ from compas.geometry import Transformation
 from compas.geometry import bestfit_plane
 from compas.geometry import distance_point_point
 from compas.geometry import transform_points
+from numpy import abs as npabs
+from numpy import array
+from numpy import asarray
+from numpy import concatenate
+from numpy import cross
+from numpy import cumsum
+from numpy import einsum
+from numpy import nonzero
+from numpy import ones
+from numpy import split
 
 try:
     from shapely.geometry import Polygon as ShapelyPolygon
@@ -16,7 +31,14 @@ except ImportError:
     print("Shapely package is not available. Please install it.")
     shapely_available = False
 
+try:
+    from shapely import prepare
+except ImportError:
+    # prepared geometries are only available as of Shapely 2
+    prepare = None
+
 import compas_model.models  # noqa: F401
+from compas_model.elements.block import BlockFaceGeometry
 
 
 def is_aabb_aabb_collision(box0, box1):
@@ -54,6 +76,209 @@ def is_aabb_aabb_collision(box0, box1):
     return True
 
 
+def get_aabb_collision_pairs(boxes, broadphase="sap"):
+    """Identify all pairs of colliding axis-aligned bounding-boxes.
+
+    Parameters
+    ----------
+    boxes : list[:class:`compas.geometry.Box`]
+        A list of axis-aligned bounding-boxes.
+    broadphase : {"sap", "numpy", "bruteforce"}, optional
+        The algorithm used for finding the colliding pairs.
+        ``"sap"`` sorts the boxes along the axis with the largest spread of their centers,
+        and only tests boxes with overlapping intervals along that axis (sweep-and-prune).
+        ``"numpy"`` tests all pairs at once with :func:`get_aabb_collision_pairs_numpy`.
+        ``"bruteforce"`` tests every pair of boxes with :func:`is_aabb_aabb_collision`.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        The index pairs ``(i, j)`` of colliding boxes, with ``i < j``, in lexicographic order.
+
+    Raises
+    ------
+    ValueError
+        If the broad phase algorithm is not supported.
+
+    """
+    if broadphase == "bruteforce":
+        pairs = []
+        for i in range(len(boxes)):
+            for j in range(i + 1, len(boxes)):
+                if is_aabb_aabb_collision(boxes[i], boxes[j]):
+                    pairs.append((i, j))
+        return pairs
+
+    if broadphase == "sap":
+        return _sweep_and_prune([_aabb_bounds(box) for box in boxes])
+
+    if broadphase == "numpy":
+        return get_aabb_collision_pairs_numpy(aabbs_to_numpy(boxes))
+
+    raise ValueError("Broad phase algorithm not supported: {}".format(broadphase))
+
+
+def aabbs_to_numpy(boxes):
+    """Pack a list of axis-aligned bounding-boxes into a single array.
+
+    Parameters
+    ----------
+    boxes : list[:class:`compas.geometry.Box`]
+        A list of axis-aligned bounding-boxes.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of shape ``(n, 2, 3)``,
+        with the minimum corner of each box in ``[:, 0]`` and the maximum corner in ``[:, 1]``.
+
+    """
+    bounds = array([_aabb_bounds(box) for box in boxes], dtype=float)
+    return bounds.reshape((-1, 2, 3))
+
+
+def get_aabb_collision_pairs_numpy(aabbs, tilesize=1024, indices=None):
+    """Identify all pairs of colliding axis-aligned bounding-boxes with vectorized comparisons.
+
+    Parameters
+    ----------
+    aabbs : numpy.ndarray
+        An array of shape ``(n, 2, 3)`` with the minimum and maximum corners of the boxes.
+        See :func:`aabbs_to_numpy`.
+    tilesize : int, optional
+        The number of boxes compared against all other boxes at once.
+        This limits the memory used by the comparisons to ``tilesize * n`` booleans.
+    indices : list[int], optional
+        If provided, only the pairs that include at least one of the boxes with these indices are identified.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        The index pairs ``(i, j)`` of colliding boxes, with ``i < j``, in lexicographic order.
+
+    Notes
+    -----
+    Touching boxes are considered to collide, to match :func:`is_aabb_aabb_collision`.
+
+    """
+    mins = aabbs[:, 0]
+    maxs = aabbs[:, 1]
+    n = len(aabbs)
+
+    if indices is not None:
+        indices = sorted(set(indices))
+        found = set()
+        for start in range(0, len(indices), tilesize):
+            selection = array(indices[start : start + tilesize], dtype=int)
+            mask = ones((len(selection), n), dtype=bool)
+            for axis in range(3):
+                mask &= maxs[selection, axis, None] >= mins[None, :, axis]
+                mask &= maxs[None, :, axis] >= mins[selection, axis, None]
+
+            rows, cols = nonzero(mask)
+            for i, j in zip(selection[rows].tolist(), cols.tolist()):
+                if i < j:
+                    found.add((i, j))
+                elif j < i:
+                    found.add((j, i))
+        return sorted(found)
+
+    pairs = []
+
+    for start in range(0, n, tilesize):
+        stop = min(start + tilesize, n)
+        # only compare against boxes with a higher index than the first box of the tile
+        mask = ones((stop - start, n - start), dtype=bool)
+        for axis in range(3):
+            mask &= maxs[start:stop, axis, None] >= mins[None, start:, axis]
+            mask &= maxs[None, start:, axis] >= mins[start:stop, axis, None]
+
+        rows, cols = nonzero(mask)
+        rows += start
+        cols += start
+        upper = rows < cols
+        pairs += zip(rows[upper].tolist(), cols[upper].tolist())
+
+    return pairs
+
+
+def _aabb_bounds(box):
+    """Extract the bounds of an axis-aligned bounding-box.
+
+    Parameters
+    ----------
+    box : :class:`compas.geometry.Box`
+        Axis-aligned bounding-box.
+
+    Returns
+    -------
+    tuple[float, float, float, float, float, float]
+        The bounds as ``(xmin, ymin, zmin, xmax, ymax, zmax)``.
+
+    """
+    return box.xmin, box.ymin, box.zmin, box.xmax, box.ymax, box.zmax
+
+
+def _sweep_and_prune(bounds):
+    """Find the overlapping pairs of a list of axis-aligned bounds by sweeping along the axis with the largest spread.
+
+    Parameters
+    ----------
+    bounds : list[tuple[float, float, float, float, float, float]]
+        The bounds of the boxes as ``(xmin, ymin, zmin, xmax, ymax, zmax)``.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        The index pairs ``(i, j)`` of overlapping bounds, with ``i < j``, in lexicographic order.
+
+    Notes
+    -----
+    The sweep axis is the axis along which the variance of the centers of the boxes is largest,
+    such that the fewest intervals overlap along the sweep axis.
+    Touching intervals are considered to overlap, to match :func:`is_aabb_aabb_collision`.
+
+    """
+    if not bounds:
+        return []
+
+    n = len(bounds)
+    variances = []
+    for axis in range(3):
+        centers = [0.5 * (box[axis] + box[axis + 3]) for box in bounds]
+        mean = sum(centers) / n
+        variances.append(sum((center - mean) ** 2 for center in centers))
+    a = variances.index(max(variances))
+    b, c = [axis for axis in range(3) if axis != a]
+
+    order = sorted(range(n), key=lambda index: bounds[index][a])
+    pairs = []
+
+    for position, i in enumerate(order):
+        box0 = bounds[i]
+        amax0 = box0[a + 3]
+        bmin0, bmax0 = box0[b], box0[b + 3]
+        cmin0, cmax0 = box0[c], box0[c + 3]
+
+        for j in order[position + 1 :]:
+            box1 = bounds[j]
+
+            # all remaining boxes start beyond the end of this one
+            if amax0 < box1[a]:
+                break
+
+            if bmax0 < box1[b] or box1[b + 3] < bmin0:
+                continue
+
+            if cmax0 < box1[c] or box1[c + 3] < cmin0:
+                continue
+
+            pairs.append((i, j) if i < j else (j, i))
+
+    pairs.sort()
+    return pairs
+
+
 def is_box_box_collision(box0, box1):
     """Verify if this box collides with another box.
 
@@ -105,6 +330,70 @@ def is_box_box_collision(box0, box1):
     return result
 
 
+def obbs_to_numpy(boxes):
+    """Pack a list of oriented bounding-boxes into stacked frame and extent arrays.
+
+    Parameters
+    ----------
+    boxes : list[:class:`compas.geometry.Box`]
+        A list of oriented bounding-boxes.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray]
+        An array of shape ``(n, 4, 3)`` with the origin, X axis, Y axis and Z axis of the frame of each box,
+        and an array of shape ``(n, 3)`` with the half sizes of each box along the axes of its frame.
+
+    """
+    frames = array([[box.frame.point, box.frame.xaxis, box.frame.yaxis, box.frame.zaxis] for box in boxes], dtype=float)
+    extents = array([[0.5 * box.width, 0.5 * box.depth, 0.5 * box.height] for box in boxes], dtype=float)
+    return frames.reshape((-1, 4, 3)), extents.reshape((-1, 3))
+
+
+def is_box_box_collision_batch(obbs_a, obbs_b):
+    """Verify if the boxes of one stack collide with the corresponding boxes of another stack.
+
+    Parameters
+    ----------
+    obbs_a : tuple[numpy.ndarray, numpy.ndarray]
+        The frames ``(n, 4, 3)`` and half sizes ``(n, 3)`` of the first boxes.
+        See :func:`obbs_to_numpy`.
+    obbs_b : tuple[numpy.ndarray, numpy.ndarray]
+        The frames ``(n, 4, 3)`` and half sizes ``(n, 3)`` of the second boxes.
+
+    Returns
+    -------
+    numpy.ndarray
+        A boolean array of shape ``(n,)``.
+        An item is True if box ``i`` of the first stack collides with box ``i`` of the second stack.
+
+    Notes
+    -----
+    This is the vectorized equivalent of :func:`is_box_box_collision`,
+    testing the same 15 separating axes for all pairs of boxes at once.
+
+    """
+    frames0, extents0 = obbs_a
+    frames1, extents1 = obbs_b
+    frames0 = asarray(frames0, dtype=float)
+    frames1 = asarray(frames1, dtype=float)
+
+    axes0 = frames0[:, 1:]
+    axes1 = frames1[:, 1:]
+    halfaxes0 = axes0 * asarray(extents0, dtype=float)[:, :, None]
+    halfaxes1 = axes1 * asarray(extents1, dtype=float)[:, :, None]
+
+    # the face normals of both boxes and the cross products of their edge directions
+    edges = cross(axes0[:, :, None, :], axes1[:, None, :, :]).reshape((-1, 9, 3))
+    axes = concatenate((axes0, axes1, edges), axis=1)
+
+    relative_position = frames1[:, 0] - frames0[:, 0]
+    distance = npabs(einsum("ij,iaj->ia", relative_position, axes))
+    radius = npabs(einsum("ikj,iaj->iak", halfaxes0, axes)).sum(axis=2) + npabs(einsum("ikj,iaj->iak", halfaxes1, axes)).sum(axis=2)
+
+    return ~(distance > radius).any(axis=1)
+
+
 def is_face_to_face_collision(
     polygons0,
     polygons1,
@@ -113,21 +402,31 @@ def is_face_to_face_collision(
     tolerance_flatness=1e-2,
     tolerance_area=1e1,
     log=False,
+    cache=None,
 ):
     """Construct interfaces by intersecting coplanar mesh faces.
 
     Parameters
     ----------
-    assembly : compas_assembly.datastructures.Assembly
-        An assembly of discrete blocks.
-    nmax : int, optional
-        Maximum number of neighbours per block.
+    polygons0 : list[:class:`compas.geometry.Polygon`]
+        The face polygons of the first element.
+    polygons1 : list[:class:`compas.geometry.Polygon`]
+        The face polygons of the second element.
+    frames0 : list[:class:`compas.geometry.Frame`], optional
+        The frames of the face polygons of the first element.
+    frames1 : list[:class:`compas.geometry.Frame`], optional
+        The frames of the face polygons of the second element.
+        If neither ``frames0`` nor ``frames1`` are provided, they are computed from the best-fit planes of the polygons.
     tolerance_flatness : float, optional
         Maximum deviation from the perfectly flat interface plane.
     tolerance_area : float, optional
         Minimum area of a "face-face" interface.
     log : bool, optional
         Log the conversion process, here the algorithms mostly fails due to user wrong inputs.
+    cache : dict, optional
+        A cache for the conversions of the polygons to shapely polygons in the planes of the frames.
+        The cache is keyed by the identity of the frame and polygon objects,
+        and can be shared between calls that use the same frame and polygon objects.
 
     Returns
     -------
@@ -145,25 +444,34 @@ def is_face_to_face_collision(
     _frames1 = frames1
 
     if _frames0 is None and _frames1 is None:
-        _frames0 = [Frame.from_plane(Plane(*bestfit_plane(polygon))) for polygon in polygons0]
-        _frames1 = [Frame.from_plane(Plane(*bestfit_plane(polygon))) for polygon in polygons1]
+        _frames0 = _polygon_frames(polygons0)
+        _frames1 = _polygon_frames(polygons1)
+
+    if cache is None:
+        cache = {}
 
     interfaces = []
+    candidates = _coplanar_frame_candidates(_frames0, _frames1)
 
     for id_0, face_polygon_0 in enumerate(polygons0):
-        matrix = Transformation.from_frame_to_frame(_frames0[id_0].copy(), Frame.worldXY())
+        if not candidates[id_0]:
+            continue
+
+        frame = _frames0[id_0]
+        matrix = _frame_matrix_cached(cache, frame)
 
-        shapely_polygon_0 = _to_shapely_polygon(matrix, face_polygon_0, tolerance_flatness, tolerance_area, log)
+        shapely_polygon_0 = _to_shapely_polygon_cached(cache, frame, matrix, face_polygon_0, tolerance_flatness, tolerance_area, log)
         if shapely_polygon_0 is None:
             if log:
                 print("Collider -> is_face_to_face_collision -> shapely_polygon_0 is None, frame or polygon is bad")
             continue
 
-        for id_1, face_polygon_1 in enumerate(polygons1):
-            if _is_parallel_and_coplanar(_frames0[id_0], _frames1[id_1]) is False:
+        for id_1 in candidates[id_0]:
+            face_polygon_1 = polygons1[id_1]
+            if _is_parallel_and_coplanar(frame, _frames1[id_1]) is False:
                 continue
 
-            shapely_polygon_1 = _to_shapely_polygon(matrix, face_polygon_1, tolerance_flatness, tolerance_area, log)
+            shapely_polygon_1 = _to_shapely_polygon_cached(cache, frame, matrix, face_polygon_1, tolerance_flatness, tolerance_area, log)
             if shapely_polygon_1 is None:
                 continue
 
@@ -181,6 +489,144 @@ def is_face_to_face_collision(
     return interfaces
 
 
+def _polygon_frames(polygons):
+    """Compute the frames of the best-fit planes of a list of polygons.
+
+    Parameters
+    ----------
+    polygons : list[:class:`compas.geometry.Polygon`]
+        The polygons.
+
+    Returns
+    -------
+    list[:class:`compas.geometry.Frame`]
+
+    """
+    return [Frame.from_plane(Plane(*bestfit_plane(polygon))) for polygon in polygons]
+
+
+def _element_faces(element):
+    """Get the face polygons of an element and the frames of their planes.
+
+    Parameters
+    ----------
+    element : :class:`compas_model.elements.Element`
+        The element.
+
+    Returns
+    -------
+    tuple[list[:class:`compas.geometry.Polygon`], list[:class:`compas.geometry.Frame`]]
+
+    Notes
+    -----
+    If the geometry of the element has cached face geometry, such as :class:`compas_model.elements.BlockGeometry`,
+    the cached face frames are used.
+    Otherwise, the frames are computed from the best-fit planes of the polygons.
+
+    """
+    polygons = element.face_polygons
+    if _has_face_frames(element, polygons):
+        return polygons, element.geometry.facegeometry.frames
+    return polygons, _polygon_frames(polygons)
+
+
+def _has_face_frames(element, polygons):
+    """Verify that the geometry of an element has cached frames for its face polygons.
+
+    Parameters
+    ----------
+    element : :class:`compas_model.elements.Element`
+        The element.
+    polygons : list[:class:`compas.geometry.Polygon`]
+        The face polygons of the element.
+
+    Returns
+    -------
+    bool
+
+    """
+    facegeometry = getattr(element.geometry, "facegeometry", None)
+    return facegeometry is not None and len(facegeometry.frames) == len(polygons)
+
+
+def _face_frames(polygons, cached):
+    """Compute the frames of a list of face polygons in a worker process.
+
+    Parameters
+    ----------
+    polygons : list[:class:`compas.geometry.Polygon`]
+        The face polygons.
+    cached : bool
+        If True, compute the frames in the same way as the cached face geometry of the element.
+        Otherwise, compute the frames of the best-fit planes.
+
+    Returns
+    -------
+    list[:class:`compas.geometry.Frame`]
+
+    """
+    if cached:
+        return [BlockFaceGeometry.face_frame(polygon.points) for polygon in polygons]
+    return _polygon_frames(polygons)
+
+
+def _frame_matrix_cached(cache, frame):
+    """Get the transformation from a frame to the world XY frame, from a conversion cache if possible.
+
+    Parameters
+    ----------
+    cache : dict
+        The conversion cache.
+    frame : :class:`compas.geometry.Frame`
+        The frame.
+
+    Returns
+    -------
+    :class:`compas.geometry.Transformation`
+
+    """
+    key = (id(frame),)
+    if key not in cache:
+        # the frame is stored with the result, to make sure its id is not reused while the cache is alive
+        cache[key] = frame, Transformation.from_frame_to_frame(frame.copy(), Frame.worldXY())
+    return cache[key][1]
+
+
+def _to_shapely_polygon_cached(cache, frame, matrix, polygon, tolerance_flatness, tolerance_area, log):
+    """Convert a compas polygon to a prepared shapely polygon in the plane of a frame, from a conversion cache if possible.
+
+    Parameters
+    ----------
+    cache : dict
+        The conversion cache.
+    frame : :class:`compas.geometry.Frame`
+        The frame defining the plane of the conversion.
+    matrix : :class:`compas.geometry.Transformation`
+        Transformation matrix to transform the polygon from the frame to the xy plane.
+    polygon : :class:`compas.geometry.Polygon`
+        Compas polygon.
+    tolerance_flatness : float
+        Tolerance for the planarity of the polygon.
+    tolerance_area : float
+        Tolerance for the area of the polygon.
+    log : bool
+        Log the conversion process.
+
+    Returns
+    -------
+    :class:`shapely.geometry.Polygon` | None
+
+    """
+    key = id(frame), id(polygon), tolerance_flatness, tolerance_area
+    if key not in cache:
+        shapely_polygon = _to_shapely_polygon(matrix, polygon, tolerance_flatness, tolerance_area, log)
+        if shapely_polygon is not None and prepare is not None:
+            prepare(shapely_polygon)
+        # the polygon is stored with the result, to make sure its id is not reused while the cache is alive
+        cache[key] = polygon, shapely_polygon
+    return cache[key][1]
+
+
 def _to_shapely_polygon(matrix, polygon, tolerance_flatness=1e-3, tolerance_area=1e-1, log=False):
     """Convert a compas polygon to shapely polygon on xy plane.
 
@@ -246,6 +692,82 @@ def _to_compas_polygon(matrix, shapely_polygon):
     return Polygon(transform_points(coords, matrix.inverted())[:-1])
 
 
+def _coplanar_frame_candidates(
+    frames0,
+    frames1,
+    tolerance_normal_colinearity=1e-1,
+    tolerance_projection_distance=1e-1,
+):
+    """Find, for every frame of a first list, the frames of a second list that can be parallel and coplanar with it.
+
+    Parameters
+    ----------
+    frames0 : list[:class:`compas.geometry.Frame`]
+        First list of frames.
+    frames1 : list[:class:`compas.geometry.Frame`]
+        Second list of frames.
+    tolerance_normal_colinearity : float, optional
+        Tolerance for the colinearity of the normals.
+    tolerance_projection_distance : float, optional
+        Tolerance for the distance between the projected points.
+
+    Returns
+    -------
+    list[list[int]]
+        For every frame of the first list, the sorted indices of the candidate frames of the second list.
+
+    Notes
+    -----
+    The frames of the second list are hashed by their quantized normal direction and plane offset.
+    The cells have the size of the largest deviation allowed by the tolerances of :func:`_is_parallel_and_coplanar`,
+    such that only the frames in the cells touched by the tolerance region of a frame of the first list need to be tested.
+    The candidates are a superset of the frames that pass :func:`_is_parallel_and_coplanar`.
+
+    """
+    if not frames0 or not frames1:
+        return [[] for _ in frames0]
+
+    everything = list(range(len(frames1)))
+    if tolerance_normal_colinearity >= 1.0:
+        return [everything for _ in frames0]
+
+    # the largest distance between two unit normals that pass the colinearity test, after flipping one of them if needed
+    normal_radius = 2 * sin(0.5 * asin(tolerance_normal_colinearity)) + 1e-12
+
+    # plane offsets are measured from a common origin,
+    # to bound the effect of the normal deviation on the offset
+    points = [frame.point for frame in frames0] + [frame.point for frame in frames1]
+    origin = [sum(axis) / len(points) for axis in zip(*points)]
+    radius = max(sum((a - b) ** 2 for a, b in zip(point, origin)) ** 0.5 for point in points)
+    offset_radius = tolerance_projection_distance + normal_radius * radius + 1e-12
+
+    def normal_and_offset(frame):
+        normal = frame.normal
+        offset = sum(n * (p - o) for n, p, o in zip(normal, frame.point, origin))
+        return list(normal) + [offset]
+
+    radii = [normal_radius] * 3 + [offset_radius]
+    sizes = [2 * r for r in radii]
+
+    index = {}
+    for id_1, frame in enumerate(frames1):
+        key = tuple(int(floor(value / size)) for value, size in zip(normal_and_offset(frame), sizes))
+        index.setdefault(key, []).append(id_1)
+
+    candidates = []
+    for frame in frames0:
+        values = normal_and_offset(frame)
+        found = set()
+        # parallel frames can have opposite normals and offsets
+        for sign in (+1, -1):
+            ranges = [range(int(floor((sign * v - r) / d)), int(floor((sign * v + r) / d)) + 1) for v, r, d in zip(values, radii, sizes)]
+            for key in product(*ranges):
+                found.update(index.get(key, ()))
+        candidates.append(sorted(found))
+
+    return candidates
+
+
 def _is_parallel_and_coplanar(
     frame0,
     frame1,
@@ -282,6 +804,122 @@ def _is_parallel_and_coplanar(
     return are_parellel and are_close
 
 
+def _polygons_to_numpy(polygons):
+    """Pack a list of polygons into a single coordinate array, for sending them to other processes.
+
+    Parameters
+    ----------
+    polygons : list[:class:`compas.geometry.Polygon`]
+        The polygons.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, list[int]]
+        The stacked coordinates of all polygon corners with shape ``(m, 3)``,
+        and the number of corners per polygon.
+
+    """
+    counts = [len(polygon.points) for polygon in polygons]
+    coordinates = array([point for polygon in polygons for point in polygon.points], dtype=float)
+    return coordinates.reshape((-1, 3)), counts
+
+
+def _numpy_to_polygons(coordinates, counts):
+    """Unpack a coordinate array into a list of polygons.
+
+    Parameters
+    ----------
+    coordinates : numpy.ndarray
+        The stacked coordinates of all polygon corners with shape ``(m, 3)``.
+    counts : list[int]
+        The number of corners per polygon.
+
+    Returns
+    -------
+    list[:class:`compas.geometry.Polygon`]
+
+    """
+    return [Polygon(points.tolist()) for points in split(coordinates, cumsum(counts)[:-1])]
+
+
+def _face_to_face_collision_task(task):
+    """Compute the face-to-face collisions of one pair of elements in a worker process.
+
+    Parameters
+    ----------
+    task : tuple
+        The packed polygons of both elements and whether their frames are cached,
+        followed by the tolerances and the log flag.
+
+    Returns
+    -------
+    list[[tuple[int, int], list[list[float]]]]
+        The face pairs and the corner coordinates of the interface polygons.
+
+    """
+    (packed0, cached0), (packed1, cached1), tolerance_flatness, tolerance_area, log = task
+    polygons0 = _numpy_to_polygons(*packed0)
+    polygons1 = _numpy_to_polygons(*packed1)
+    interfaces = is_face_to_face_collision(
+        polygons0,
+        polygons1,
+        _face_frames(polygons0, cached0),
+        _face_frames(polygons1, cached1),
+        tolerance_flatness,
+        tolerance_area,
+        log,
+    )
+    return [[faces, [list(point) for point in polygon.points]] for faces, polygon in interfaces]
+
+
+def _get_face_to_face_collisions_parallel(elements, pairs, tolerance_flatness, tolerance_area, log, executor, workers):
+    """Compute the face-to-face collisions of pairs of elements in a pool of processes.
+
+    Parameters
+    ----------
+    elements : list[:class:`compas_model.elements.Element`]
+        The elements.
+    pairs : list[tuple[int, int]]
+        The candidate pairs of element indices.
+    tolerance_flatness : float
+        Maximum deviation from the perfectly flat interface plane.
+    tolerance_area : float
+        Minimum area of a "face-face" interface.
+    log : bool
+        Log the conversion process.
+    executor : :class:`concurrent.futures.Executor` | None
+        An existing executor.
+        If None, a process pool with the given number of workers is created for this call.
+    workers : int | None
+        The number of worker processes of the pool.
+
+    Returns
+    -------
+    list
+        The interfaces per candidate pair, in the order of the pairs.
+
+    """
+    packed = {}
+    for pair in pairs:
+        for index in pair:
+            if index not in packed:
+                # the frames are rebuilt in the worker from the polygon coordinates,
+                # in the same way as the cached frames, such that the results match the serial path
+                polygons = elements[index].face_polygons
+                packed[index] = _polygons_to_numpy(polygons), _has_face_frames(elements[index], polygons)
+
+    tasks = [(packed[i], packed[j], tolerance_flatness, tolerance_area, log) for i, j in pairs]
+
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(tasks) // (4 * (workers or 1)))
+            results = list(pool.map(_face_to_face_collision_task, tasks, chunksize=chunksize))
+    else:
+        results = list(executor.map(_face_to_face_collision_task, tasks))
+
+    return [[[faces, Polygon(points)] for faces, points in result] for result in results]
+
+
 def get_collision_pairs(
     model,
     aabb_and_obb_inflation=0.01,
@@ -290,8 +928,12 @@ def get_collision_pairs(
     tolerance_flatness=1e-2,
     tolerance_area=1e1,
     log=False,
+    broadphase="sap",
+    executor=None,
+    workers=None,
+    incremental=False,
 ):
-    # type: (compas_model.models.Model, float, bool, bool, float, float, bool) -> list
+    # type: (compas_model.models.Model, float, bool, bool, float, float, bool, str, object | None, int | None, bool) -> list
     """Get the collision pairs of the elements in the model.
 
     Parameters
@@ -312,6 +954,21 @@ def get_collision_pairs(
         Minimum area of a "face-face" interface.
     log : bool, optional
         Log the conversion process, here the algorithms mostly fails due to user wrong inputs.
+    broadphase : {"sap", "numpy", "bruteforce"}, optional
+        The algorithm used for finding the pairs of elements with colliding axis-aligned bounding-boxes.
+        See :func:`get_aabb_collision_pairs`.
+    executor : :class:`concurrent.futures.Executor`, optional
+        An executor for computing the face-to-face collisions of the candidate pairs in parallel.
+        The executor should be able to run module-level functions, for example a :class:`concurrent.futures.ProcessPoolExecutor`.
+    workers : int, optional
+        The number of processes for computing the face-to-face collisions in parallel,
+        if no executor is provided.
+        If None or 1, the collisions are computed serially.
+    incremental : bool, optional
+        If True, only the collision pairs that include at least one of the elements
+        that were added or moved since the last call to :meth:`compas_model.models.Model.clear_modified` are computed.
+        The modified marks are not cleared, such that they can be used by other incremental algorithms as well.
+        See :meth:`compas_model.models.Model.modified_elements`.
 
     Returns
     -------
@@ -322,32 +979,59 @@ def get_collision_pairs(
 
     elements = list(model.elements())
 
-    for e in elements:
-        e.compute_aabb(aabb_and_obb_inflation)
-        e.compute_obb(aabb_and_obb_inflation)
+    # the bounding boxes of the elements are computed only once, and cached by the elements
+    # the inflation is applied to the arrays of the cached boxes
+    inflate = 0.5 * aabb_and_obb_inflation
+
+    if incremental:
+        modified = set(element.guid for element in model.modified_elements())
+        indices = [index for index, element in enumerate(elements) if element.guid in modified]
+        aabbs = aabbs_to_numpy([element.aabb for element in elements])
+        aabbs[:, 0] -= inflate
+        aabbs[:, 1] += inflate
+        pairs = get_aabb_collision_pairs_numpy(aabbs, indices=indices)
+    else:
+        pairs = get_aabb_collision_pairs([element.get_aabb(aabb_and_obb_inflation) for element in elements], broadphase=broadphase)
 
-    collision_pairs = []
-    for i in range(len(elements)):
-        for j in range(i + 1, len(elements)):
-            if not is_aabb_aabb_collision(elements[i].aabb, elements[j].aabb):
-                continue
+    if obb_obb and pairs:
+        frames, extents = obbs_to_numpy([element.obb for element in elements])
+        extents += inflate
+        a, b = array(pairs).T
+        collisions = is_box_box_collision_batch((frames[a], extents[a]), (frames[b], extents[b]))
+        pairs = [pair for pair, collision in zip(pairs, collisions.tolist()) if collision]
+
+    if not face_to_face:
+        return [[i, j] for i, j in pairs]
 
-            if not obb_obb or is_box_box_collision(elements[i].obb, elements[j].obb):
-                if not face_to_face:
-                    collision_pairs.append([i, j])
-                else:
-                    interfaces = is_face_to_face_collision(
-                        elements[i].face_polygons,
-                        elements[j].face_polygons,
-                        None,
-                        None,
-                        tolerance_flatness,
-                        tolerance_area,
-                        log,
-                    )
-                    if interfaces:
-                        result = [i, j]
-                        result.append(interfaces)
-                        collision_pairs.append(result)
+    if executor is not None or (workers and workers > 1):
+        pair_interfaces = _get_face_to_face_collisions_parallel(elements, pairs, tolerance_flatness, tolerance_area, log, executor, workers)
+    else:
+        # the polygons, frames and shapely conversions of an element are shared by all pairs that include it
+        faces = {}
+        for pair in pairs:
+            for index in pair:
+                if index not in faces:
+                    faces[index] = _element_faces(elements[index])
+        cache = {}
+        pair_interfaces = (
+            is_face_to_face_collision(
+                faces[i][0],
+                faces[j][0],
+                faces[i][1],
+                faces[j][1],
+                tolerance_flatness,
+                tolerance_area,
+                log,
+                cache=cache,
+            )
+            for i, j in pairs
+        )
+
+    collision_pairs = []
+    for (i, j), interfaces in zip(pairs, pair_interfaces):
+        if interfaces:
+            result = [i, j]
+            result.append(interfaces)
+            collision_pairs.append(result)
 
     return collision_pairs
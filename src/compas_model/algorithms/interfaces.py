@@ -1,16 +1,29 @@
-from math import fabs
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 from typing import List
 
+import shapely
 from compas.datastructures import Mesh
 from compas.geometry import Frame
 from compas.geometry import Plane
 from compas.geometry import Polygon
-from compas.geometry import Transformation
 from compas.geometry import centroid_polygon
 from compas.geometry import is_colinear
 from compas.geometry import is_coplanar
-from compas.geometry import transform_points
 from compas.itertools import window
+from numpy import abs as npabs
+from numpy import array
+from numpy import column_stack
+from numpy import cumsum
+from numpy import diff
+from numpy import einsum
+from numpy import float64
+from numpy import full
+from numpy import int64
+from numpy import logical_and
+from numpy import ndarray
+from numpy import nonzero
+from numpy import split
 from shapely.geometry import Polygon as ShapelyPolygon
 
 # from compas_model.elements import BlockElement
@@ -18,7 +31,11 @@ from compas_model.elements import BlockGeometry
 from compas_model.interactions import ContactInterface
 from compas_model.models import Model
 
-from .nnbrs import find_nearest_neighbours
+from .collisions import _sweep_and_prune
+from .collisions import aabbs_to_numpy
+from .collisions import get_aabb_collision_pairs_numpy
+from .nnbrs import find_nearest_neighbours_numpy
+from .nnbrs import find_neighbours_in_radius_numpy
 
 
 def blockmodel_interfaces(
@@ -27,6 +44,10 @@ def blockmodel_interfaces(
     tmax: float = 1e-6,
     amin: float = 1e-2,
     nnbrs_dims: int = 3,
+    incremental: bool = False,
+    radius: float = None,
+    neighbours: str = "centroids",
+    workers: int = None,
 ):
     """Identify the interfaces between the blocks of an assembly.
 
@@ -40,51 +61,345 @@ def blockmodel_interfaces(
         Maximum deviation from the perfectly flat interface plane.
     amin : float, optional
         Minimum area of a "face-face" interface.
+    nnbrs_dims : int, optional
+        The number of coordinates of the block centroids taken into account for the neighbour search.
+    incremental : bool, optional
+        If True, only the interfaces of the blocks that were added or moved since the last call to
+        :meth:`compas_model.models.Model.clear_modified` are recomputed.
+        The interactions between all other blocks are left untouched.
+        The candidate neighbours of the modified blocks are the blocks with overlapping axis-aligned bounding boxes.
+        The modified marks are not cleared, such that they can be used by other incremental algorithms as well.
+        See :meth:`compas_model.models.Model.modified_elements`.
+    radius : float, optional
+        If provided, the candidate neighbours of a block are all blocks with a centroid within this distance,
+        instead of the ``nmax`` blocks with the nearest centroids.
+    neighbours : {"centroids", "aabb"}, optional
+        The strategy for finding the candidate neighbours of the blocks.
+        With ``"centroids"``, the candidates are the blocks with the nearest centroids (see ``nmax`` and ``radius``).
+        With ``"aabb"``, the candidates are the blocks with overlapping axis-aligned bounding boxes,
+        inflated with ``tmax``, found with a sweep-and-prune over the boxes.
+        This finds all touching blocks, independently of their relative sizes.
+    workers : int, optional
+        The number of processes for computing the interfaces of the candidate pairs in parallel.
+        The vertex and face arrays of the blocks are shared with the processes through shared memory.
+        If None or 1, the interfaces are computed serially.
 
     Returns
     -------
     :class:`Assembly`
 
+    Raises
+    ------
+    ValueError
+        If the neighbour search strategy is not supported.
+
     """
+    if neighbours not in ("centroids", "aabb"):
+        raise ValueError("Neighbour search strategy not supported: {}".format(neighbours))
+
+    if incremental:
+        _update_blockmodel_interfaces(model, tmax, amin, workers)
+        return model
+
     node_index = {node: index for index, node in enumerate(model.graph.nodes())}
     index_node = {index: node for index, node in enumerate(model.graph.nodes())}
 
     blocks: List[BlockGeometry] = [model.graph.node_element(node).geometry for node in model.graph.nodes()]
 
-    nmax = min(nmax, len(blocks))
+    if neighbours == "aabb":
+        block_nbrs = [[] for _ in blocks]
+        for i, j in _get_aabb_neighbour_pairs(model, tmax):
+            block_nbrs[i].append(j)
 
-    block_cloud = [block.centroid() for block in blocks]
-    block_nnbrs = find_nearest_neighbours(block_cloud, nmax, dims=nnbrs_dims)
+    elif radius is not None:
+        block_cloud = [block.centroid() for block in blocks]
+        block_nbrs = find_neighbours_in_radius_numpy(block_cloud, radius, dims=nnbrs_dims)
+    else:
+        block_cloud = [block.centroid() for block in blocks]
+        nmax = min(nmax, len(blocks))
+        block_nbrs = find_nearest_neighbours_numpy(block_cloud, nmax, dims=nnbrs_dims)[1].tolist()
 
-    model.graph.edge = {node: {} for node in model.graph.nodes()}
+    # every pair of blocks is tested only once, in the orientation in which it is first encountered
+    pairs = []
+    visited = set()
 
     for node in model.graph.nodes():
         i = node_index[node]
 
-        block = blocks[i]
-        nbrs = block_nnbrs[i][1]
-
-        for j in nbrs:
-            n = index_node[j]
-
-            if n == node:
+        for j in block_nbrs[i]:
+            if j == i:
                 # a block has no interfaces with itself
                 continue
 
-            if model.graph.has_edge((n, node), directed=False):
-                # the interfaces between these two blocks have already been identified
+            if (j, i) in visited or (i, j) in visited:
                 continue
 
-            nbr = blocks[j]
+            visited.add((i, j))
+            pairs.append((i, j))
 
-            interfaces = mesh_mesh_interfaces(block, nbr, tmax, amin)
+    model.graph.clear_edges()
 
-            if interfaces:
-                model.graph.add_edge(node, n, interactions=interfaces)
+    for (i, j), interfaces in zip(pairs, _compute_pair_interfaces(blocks, pairs, tmax, amin, workers)):
+        if interfaces:
+            model.graph.add_edge(index_node[i], index_node[j], interactions=interfaces)
 
     return model
 
 
+def _compute_pair_interfaces(blocks: List[BlockGeometry], pairs: list[tuple[int, int]], tmax: float, amin: float, workers: int = None) -> list:
+    """Compute the interfaces between pairs of blocks, serially or in a pool of processes.
+
+    Parameters
+    ----------
+    blocks : list[:class:`BlockGeometry`]
+        The block geometries.
+    pairs : list[tuple[int, int]]
+        The index pairs of the blocks.
+    tmax : float
+        Maximum deviation from the perfectly flat interface plane.
+    amin : float
+        Minimum area of a "face-face" interface.
+    workers : int, optional
+        The number of processes.
+
+    Returns
+    -------
+    list[list[:class:`ContactInterface`]]
+        The interfaces of every pair, in the order of the pairs.
+
+    """
+    if not workers or workers < 2 or len(pairs) < 2:
+        return [mesh_mesh_interfaces(blocks[i], blocks[j], tmax, amin) for i, j in pairs]
+
+    arrays = _blocks_to_numpy(blocks)
+    memory = []
+    try:
+        specs = []
+        for data in arrays:
+            shm = shared_memory.SharedMemory(create=True, size=max(data.nbytes, 1))
+            memory.append(shm)
+            ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)[:] = data
+            specs.append((shm.name, data.shape, data.dtype.str))
+
+        tasks = [(i, j, tmax, amin) for i, j in pairs]
+        chunksize = max(1, len(tasks) // (4 * workers))
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_interfaces_worker, initargs=(specs,)) as pool:
+            results = list(pool.map(_pair_interfaces_task, tasks, chunksize=chunksize))
+    finally:
+        for shm in memory:
+            shm.close()
+            shm.unlink()
+
+    return [[ContactInterface(size=size, points=points, frame=Frame(*frame)) for size, points, frame in result] for result in results]
+
+
+def _blocks_to_numpy(blocks: List[BlockGeometry]) -> tuple:
+    """Export the vertices and faces of a list of blocks to flat arrays.
+
+    Parameters
+    ----------
+    blocks : list[:class:`BlockGeometry`]
+        The block geometries.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        The stacked vertex coordinates of all blocks,
+        the offsets of the vertices of every block in the stacked coordinates,
+        the stacked vertex indices of all faces, relative to the vertices of their block,
+        the number of vertices of every face,
+        and the offsets of the faces of every block in the face counts.
+
+    """
+    xyz = []
+    vertex_offsets = [0]
+    corners = []
+    counts = []
+    face_offsets = [0]
+
+    for block in blocks:
+        facegeometry = block.facegeometry
+        xyz += facegeometry.vertices.tolist()
+        vertex_offsets.append(len(xyz))
+        for vertices in facegeometry.face_vertices:
+            corners += vertices
+            counts.append(len(vertices))
+        face_offsets.append(len(counts))
+
+    return (
+        array(xyz, dtype=float64).reshape((-1, 3)),
+        array(vertex_offsets, dtype=int64),
+        array(corners, dtype=int64),
+        array(counts, dtype=int64),
+        array(face_offsets, dtype=int64),
+    )
+
+
+_worker_memory = []
+_worker_arrays = None
+_worker_blocks = {}
+
+
+def _init_interfaces_worker(specs: list) -> None:
+    """Attach a worker process to the shared block arrays.
+
+    Parameters
+    ----------
+    specs : list[tuple[str, tuple, str]]
+        The name, shape and data type of every shared array.
+
+    Returns
+    -------
+    None
+
+    """
+    global _worker_arrays
+
+    arrays = []
+    for name, shape, dtype in specs:
+        shm = shared_memory.SharedMemory(name=name)
+        _worker_memory.append(shm)
+        arrays.append(ndarray(shape, dtype=dtype, buffer=shm.buf))
+
+    _worker_arrays = arrays
+    _worker_blocks.clear()
+
+
+def _worker_block(index: int) -> BlockGeometry:
+    """Reconstruct a block from the shared arrays in a worker process.
+
+    Parameters
+    ----------
+    index : int
+        The index of the block.
+
+    Returns
+    -------
+    :class:`BlockGeometry`
+
+    """
+    if index not in _worker_blocks:
+        xyz, vertex_offsets, corners, counts, face_offsets = _worker_arrays
+        vertices = xyz[vertex_offsets[index] : vertex_offsets[index + 1]].tolist()
+        start = int(counts[: face_offsets[index]].sum())
+        faces = []
+        for count in counts[face_offsets[index] : face_offsets[index + 1]].tolist():
+            faces.append(corners[start : start + count].tolist())
+            start += count
+        _worker_blocks[index] = BlockGeometry.from_vertices_and_faces(vertices, faces)
+    return _worker_blocks[index]
+
+
+def _pair_interfaces_task(task: tuple) -> list:
+    """Compute the interfaces between a pair of blocks in a worker process.
+
+    Parameters
+    ----------
+    task : tuple[int, int, float, float]
+        The indices of the blocks, and the tolerances.
+
+    Returns
+    -------
+    list[tuple[float, list, tuple]]
+        The size, the corner points, and the frame parameters of every interface.
+
+    """
+    i, j, tmax, amin = task
+    interfaces = mesh_mesh_interfaces(_worker_block(i), _worker_block(j), tmax, amin)
+    return [
+        (
+            interface.size,
+            [list(point) for point in interface.points],
+            (list(interface.frame.point), list(interface.frame.xaxis), list(interface.frame.yaxis)),
+        )
+        for interface in interfaces
+    ]
+
+
+def _get_aabb_neighbour_pairs(model: Model, tmax: float) -> list[tuple[int, int]]:
+    """Find the pairs of blocks with overlapping inflated axis-aligned bounding boxes.
+
+    Parameters
+    ----------
+    model : :class:`compas_model.models.Model`
+        A block model.
+    tmax : float
+        The inflation of the boxes.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        The index pairs ``(i, j)``, with ``i < j``, of the blocks in the order of the nodes of the interaction graph.
+
+    """
+    aabbs = aabbs_to_numpy([model.graph.node_element(node).aabb for node in model.graph.nodes()])
+    aabbs[:, 0] -= tmax
+    aabbs[:, 1] += tmax
+    return _sweep_and_prune(aabbs.reshape((-1, 6)).tolist())
+
+
+def _update_blockmodel_interfaces(model: Model, tmax: float, amin: float, workers: int = None) -> None:
+    """Recompute the interfaces of the modified blocks of a model.
+
+    Parameters
+    ----------
+    model : :class:`compas_model.models.Model`
+        A block model.
+    tmax : float
+        Maximum deviation from the perfectly flat interface plane.
+    amin : float
+        Minimum area of a "face-face" interface.
+    workers : int, optional
+        The number of processes for computing the interfaces in parallel.
+
+    Returns
+    -------
+    None
+
+    """
+    nodes = list(model.graph.nodes())
+    elements = [model.graph.node_element(node) for node in nodes]
+
+    modified = set(element.guid for element in model.modified_elements())
+    indices = [index for index, element in enumerate(elements) if element.guid in modified]
+
+    if not indices:
+        return
+
+    for index in indices:
+        node = nodes[index]
+        for nbr in list(model.graph.neighbors(node)):
+            edge = model.graph.find_edge(node, nbr)
+            while edge:
+                model.graph.delete_edge(edge)
+                edge = model.graph.find_edge(node, nbr)
+
+    # touching blocks have touching bounding boxes
+    # the boxes are inflated with the flatness tolerance to include blocks that are not exactly touching
+    aabbs = aabbs_to_numpy([element.aabb for element in elements])
+    aabbs[:, 0] -= tmax
+    aabbs[:, 1] += tmax
+
+    selected = set(indices)
+    pairs = []
+
+    for i, j in get_aabb_collision_pairs_numpy(aabbs, indices=indices):
+        if i not in selected:
+            i, j = j, i
+        pairs.append((i, j))
+
+    # only the blocks involved in the candidate pairs are needed
+    involved = sorted(set(index for pair in pairs for index in pair))
+    local = {index: position for position, index in enumerate(involved)}
+    blocks = [elements[index].geometry for index in involved]
+    local_pairs = [(local[i], local[j]) for i, j in pairs]
+
+    for (i, j), interfaces in zip(pairs, _compute_pair_interfaces(blocks, local_pairs, tmax, amin, workers)):
+        if interfaces:
+            model.graph.add_edge(nodes[i], nodes[j], interactions=interfaces)
+
+
 def mesh_mesh_interfaces(
     a: BlockGeometry,
     b: BlockGeometry,
@@ -106,57 +421,91 @@ def mesh_mesh_interfaces(
     -------
     List[:class:`ContactInterface`]
 
+    Notes
+    -----
+    The planes of all faces of both meshes are taken from the cached face geometry of the blocks.
+    Only the pairs of faces with opposite normals,
+    for which all vertices of the face of ``b`` lie within ``tmax`` of the plane of the face of ``a``,
+    are converted to shapely polygons and intersected.
+
     """
-    world = Frame.worldXY()
+    faces = a.facegeometry
+    tests = b.facegeometry
+
+    if not faces.faces or not tests.faces:
+        return []
+
+    frames = faces.frames
+    origins = faces.centers
+    xaxes = faces.xaxes
+    yaxes = faces.yaxes
+    zaxes = faces.zaxes
+
+    vertices = tests.vertices
+    corners = tests.face_vertices
+    normals = tests.normals
+
+    counts = [len(test) for test in corners]
+    offsets = cumsum([0] + counts[:-1])
+    flat = [index for test in corners for index in test]
+
+    # the distances of all vertices of b to the planes of all faces of a
+    distances = npabs(einsum("ikj,ij->ik", vertices[None, :, :] - origins[:, None, :], zaxes))
+    coplanar = logical_and.reduceat(distances[:, flat] < tmax, offsets, axis=1)
+    opposed = einsum("ij,kj->ik", zaxes, normals) < 0
+
     interfaces = []
-    frames = a.frames()
+    polygons = {}
 
-    for face in a.faces():
-        points = a.face_coordinates(face)
-        frame = frames[face]
-        matrix = Transformation.from_change_of_basis(world, frame)
-        projected = transform_points(points, matrix)
-        p0 = ShapelyPolygon(projected)
+    for i, j in zip(*nonzero(coplanar & opposed)):
+        i = int(i)
+        j = int(j)
 
-        for test in b.faces():
-            points = b.face_coordinates(test)
-            projected = transform_points(points, matrix)
-            p1 = ShapelyPolygon(projected)
+        origin = origins[i]
+        xaxis = xaxes[i]
+        yaxis = yaxes[i]
+        frame = frames[i]
 
-            if not all(fabs(point[2]) < tmax for point in projected):
-                continue
+        points = vertices[corners[j]] - origin
+        p1 = ShapelyPolygon(column_stack((points.dot(xaxis), points.dot(yaxis))))
 
-            if p1.area < amin:
-                continue
+        if p1.area < amin:
+            continue
 
-            if not p0.intersects(p1):
-                continue
+        if i not in polygons:
+            points = faces.vertices[faces.face_vertices[i]] - origin
+            polygons[i] = ShapelyPolygon(column_stack((points.dot(xaxis), points.dot(yaxis))))
 
-            intersection = p0.intersection(p1)
-            area = intersection.area
+        p0 = polygons[i]
 
-            if area < amin:
-                continue
+        if not p0.intersects(p1):
+            continue
 
-            coords = [[x, y, 0.0] for x, y, _ in intersection.exterior.coords]
-            coords = transform_points(coords, matrix.inverted())[:-1]
+        intersection = p0.intersection(p1)
+        area = intersection.area
 
-            interface = ContactInterface(
-                size=area,
-                points=coords,
-                frame=Frame(
-                    centroid_polygon(coords),
-                    frame.xaxis,
-                    frame.yaxis,
-                ),
-            )
+        if area < amin:
+            continue
+
+        xy = array(intersection.exterior.coords, dtype=float)[:-1, :2]
+        coords = (origin + xy[:, :1] * xaxis + xy[:, 1:] * yaxis).tolist()
 
-            interfaces.append(interface)
+        interface = ContactInterface(
+            size=area,
+            points=coords,
+            frame=Frame(
+                centroid_polygon(coords),
+                frame.xaxis,
+                frame.yaxis,
+            ),
+        )
+
+        interfaces.append(interface)
 
     return interfaces
 
 
-def merge_coplanar_interfaces(model: Model, tol: float = 1e-6) -> None:
+def merge_coplanar_interfaces(model: Model, tol: float = 1e-6, method: str = "mesh") -> None:
     """Merge connected coplanar interfaces between pairs of blocks.
 
     Parameters
@@ -165,73 +514,240 @@ def merge_coplanar_interfaces(model: Model, tol: float = 1e-6) -> None:
         A block model with identified interfaces.
     tol : float, optional
         The tolerance for coplanarity.
+    method : Literal["mesh", "union", "coverage"], optional
+        The merge strategy.
+        ``"mesh"`` merges adjacent coplanar faces of a mesh constructed from the interfaces of every edge.
+        ``"union"`` merges the interfaces of all edges with one batched call to :func:`shapely.union_all`.
+        ``"coverage"`` does the same with :func:`shapely.coverage_union_all`,
+        which is faster but requires the interfaces of every plane not to overlap.
 
     Returns
     -------
     None
 
+    Raises
+    ------
+    ValueError
+        If the merge method is not supported.
+
+    Notes
+    -----
+    With ``method="mesh"``, the interfaces of every edge are converted to the faces of a mesh.
+    Adjacent coplanar faces are grouped with a union-find structure in a single pass over the face adjacency,
+    and every group is replaced by one interface bounded by the outer boundary of the group.
+
+    With ``method="union"`` or ``method="coverage"``, the interfaces of every edge are grouped per plane,
+    and projected into the plane of the first interface of their group.
+    The projected polygons of all groups of all edges are then merged at once,
+    and every connected region of the result is converted to one interface.
+    Regions with holes cannot be represented by a single interface,
+    so the original interfaces of such regions are kept, as with ``method="mesh"``.
+
     """
+    if method == "mesh":
+        _merge_coplanar_interfaces_mesh(model, tol)
+    elif method in ("union", "coverage"):
+        _merge_coplanar_interfaces_shapely(model, tol, coverage=method == "coverage")
+    else:
+        raise ValueError("Unsupported merge method: {}".format(method))
+
+
+def _merge_coplanar_interfaces_mesh(model: Model, tol: float) -> None:
+    """Merge adjacent coplanar interfaces through the faces of a mesh per edge."""
     for edge in model.graph.edges():
-        interfaces: List[ContactInterface] = model.graph.edge_attribute(edge, "interfaces")
+        interfaces: List[ContactInterface] = model.graph.edge_attribute(edge, "interactions")
 
-        if interfaces:
-            polygons = []
-            for interface in interfaces:
-                points = []
-                for a, b, c in window(interface.points + interface.points[:2], 3):
-                    if not is_colinear(a, b, c):
-                        points.append(b)
+        if not interfaces or len(interfaces) < 2:
+            continue
 
-                polygons.append(Polygon(points))
+        if not all(isinstance(interface, ContactInterface) for interface in interfaces):
+            continue
 
+        polygons = [Polygon(_remove_colinear_points(interface.points)) for interface in interfaces]
+
+        temp = Mesh.from_polygons(polygons)
+        try:
+            temp.unify_cycles()
+        except Exception:
+            # the interfaces do not form a single connected patch
+            # orienting them along the first interface is enough for merging coplanar neighbours
+            normal = polygons[0].normal
+            polygons = [polygon if polygon.normal.dot(normal) >= 0 else Polygon(polygon.points[::-1]) for polygon in polygons]
             temp = Mesh.from_polygons(polygons)
-            try:
-                temp.unify_cycles()
-            except Exception:
-                continue
 
-            reconstruct = False
+        parent = {face: face for face in temp.faces()}
+
+        def find(face):
+            root = face
+            while parent[root] != root:
+                root = parent[root]
+            while parent[face] != root:
+                parent[face], face = root, parent[face]
+            return root
+
+        for face in temp.faces():
+            vertices = temp.face_vertices(face)
+            for nbr in temp.face_neighbors(face):
+                if nbr < face:
+                    continue
+                root = find(face)
+                other = find(nbr)
+                if root == other:
+                    continue
+                points = temp.face_coordinates(face)
+                for vertex in temp.face_vertices(nbr):
+                    if vertex not in vertices:
+                        points.append(temp.vertex_coordinates(vertex))
+                if is_coplanar(points, tol=tol):
+                    parent[other] = root
+
+        groups = {}
+        for face in temp.faces():
+            groups.setdefault(find(face), []).append(face)
+
+        if len(groups) == temp.number_of_faces():
+            continue
+
+        interfaces = []
+        for faces in groups.values():
+            if len(faces) == 1:
+                points = temp.face_coordinates(faces[0])
+            else:
+                boundary = _group_boundary(temp, faces)
+                if not boundary:
+                    # the group has holes or touches itself in a vertex
+                    for face in faces:
+                        interfaces.append(_face_interface(temp.face_coordinates(face)))
+                    continue
+                points = _remove_colinear_points([temp.vertex_coordinates(vertex) for vertex in boundary])
+            interfaces.append(_face_interface(points))
+
+        model.graph.edge_attribute(edge, "interactions", interfaces)
+
+
+def _merge_coplanar_interfaces_shapely(model: Model, tol: float, coverage: bool = False) -> None:
+    """Merge coplanar interfaces of all edges with one batched shapely union."""
+    edges = []
+    groups = []
+
+    for edge in model.graph.edges():
+        interfaces: List[ContactInterface] = model.graph.edge_attribute(edge, "interactions")
+
+        if not interfaces or len(interfaces) < 2:
+            continue
 
-            while True:
-                if temp.number_of_faces() < 2:
+        if not all(isinstance(interface, ContactInterface) for interface in interfaces):
+            continue
+
+        planes = []
+        for interface in interfaces:
+            points = array(interface.points, dtype=float)
+            for plane in planes:
+                if (npabs((points - plane[0]).dot(plane[3])) < tol).all():
+                    plane[4].append(points)
+                    plane[5].append(interface)
                     break
+            else:
+                polygon = Polygon(interface.points)
+                frame = Frame.from_plane(Plane(polygon.centroid, polygon.normal))
+                planes.append((array(frame.point), array(frame.xaxis), array(frame.yaxis), array(frame.zaxis), [points], [interface]))
+
+        if len(planes) == len(interfaces):
+            continue
+
+        edges.append(edge)
+        groups.append(planes)
+
+    if not edges:
+        return
+
+    # the projected polygons of all planes of all edges
+    # padded with None into a single array with one row per plane
+    planes = [plane for planes in groups for plane in planes]
+    polygons = []
+    for origin, xaxis, yaxis, zaxis, points, _ in planes:
+        polygons.append([ShapelyPolygon(column_stack(((xyz - origin).dot(xaxis), (xyz - origin).dot(yaxis)))) for xyz in points])
+    rows = full((len(polygons), max(len(row) for row in polygons)), None, dtype=object)
+    for i, row in enumerate(polygons):
+        rows[i, : len(row)] = row
+
+    if coverage:
+        merged = shapely.coverage_union_all(rows, axis=1)
+    else:
+        merged = shapely.union_all(rows, axis=1)
+
+    merged = shapely.simplify(merged, 0)
+    parts, part_plane = shapely.get_parts(merged, return_index=True)
+    areas = shapely.area(parts)
+    holes = shapely.get_num_interior_rings(parts)
+    coords, part_index = shapely.get_coordinates(shapely.get_exterior_ring(parts), return_index=True)
+    part_coords = split(coords, nonzero(diff(part_index))[0] + 1)
+
+    regions = [[] for _ in planes]
+    for plane, part, area, nholes, xy in zip(part_plane.tolist(), parts, areas.tolist(), holes.tolist(), part_coords):
+        if nholes:
+            # regions with holes are not merged, as with the mesh method
+            # the original interfaces of the region are kept instead
+            inside = shapely.contains(part, shapely.point_on_surface(polygons[plane]))
+            regions[plane] += [interface for interface, keep in zip(planes[plane][5], inside.tolist()) if keep]
+            continue
+        o, x, y, z = planes[plane][:4]
+        points = (o + xy[:-1, :1] * x + xy[:-1, 1:] * y).tolist()
+        regions[plane].append(
+            ContactInterface(
+                size=area,
+                points=points,
+                frame=Frame(centroid_polygon(points), x, y),
+            )
+        )
 
-                has_merged = False
+    index = 0
+    for edge, planes in zip(edges, groups):
+        interfaces = []
+        for _ in planes:
+            interfaces += regions[index]
+            index += 1
+        model.graph.edge_attribute(edge, "interactions", interfaces)
 
-                for face in temp.faces():
-                    nbrs = temp.face_neighbors(face)
-                    points = temp.face_coordinates(face)
-                    vertices = temp.face_vertices(face)
 
-                    for nbr in nbrs:
-                        for vertex in temp.face_vertices(nbr):
-                            if vertex not in vertices:
-                                points.append(temp.vertex_coordinates(vertex))
+def _remove_colinear_points(points: list) -> list:
+    """Remove the points of a closed polygon that are colinear with their neighbours."""
+    return [b for a, b, c in window(points + points[:2], 3) if not is_colinear(a, b, c)]
 
-                        if is_coplanar(points, tol=tol):
-                            temp.merge_faces([face, nbr])
-                            has_merged = True
-                            reconstruct = True
-                            break
 
-                    if has_merged:
-                        break
+def _group_boundary(mesh: Mesh, faces: list) -> list:
+    """Compute the boundary cycle of a connected group of faces of a mesh.
 
-                if not has_merged:
-                    break
+    Returns an empty list if the boundary does not consist of exactly one cycle.
 
-            if reconstruct:
-                interfaces = []
-                for face in temp.faces():
-                    points = temp.face_coordinates(face)
-                    area = temp.face_area(face)
-                    frame = Frame.from_plane(Plane(temp.face_centroid(face), temp.face_normal(face)))
-                    interface = ContactInterface(
-                        points=points,
-                        frame=frame,
-                        size=area,
-                        mesh=Mesh.from_polygons([points]),
-                    )
-                    interfaces.append(interface)
-
-                model.graph.edge_attribute(edge, "interfaces", interfaces)
+    """
+    group = set(faces)
+    successor = {}
+    for face in faces:
+        for u, v in mesh.face_halfedges(face):
+            if mesh.halfedge[v][u] not in group:
+                if u in successor:
+                    return []
+                successor[u] = v
+
+    start = next(iter(successor))
+    cycle = [start]
+    vertex = successor[start]
+    while vertex != start:
+        cycle.append(vertex)
+        vertex = successor[vertex]
+
+    if len(cycle) != len(successor):
+        return []
+    return cycle
+
+
+def _face_interface(points: list) -> ContactInterface:
+    """Construct an interface from the points of a planar polygon."""
+    polygon = Polygon(points)
+    return ContactInterface(
+        points=points,
+        frame=Frame.from_plane(Plane(polygon.centroid, polygon.normal)),
+        size=polygon.area,
+        mesh=Mesh.from_polygons([points]),
+    )
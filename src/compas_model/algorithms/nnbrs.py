@@ -3,8 +3,82 @@ from scipy.spatial import cKDTree
 
 
 def find_nearest_neighbours(cloud, nmax, dims=3):
-    cloud = asarray(cloud)[:, :dims]
+    distances, indices = find_nearest_neighbours_numpy(cloud, nmax, dims=dims)
+    return list(zip(distances.tolist(), indices.tolist()))
+
+
+def find_nearest_neighbours_numpy(cloud, nmax, dims=3, workers=-1):
+    """Find the nearest neighbours of all points of a cloud with a single query of a KD tree.
+
+    Parameters
+    ----------
+    cloud : list[[float, float, float]] | numpy.ndarray
+        The points of the cloud.
+    nmax : int
+        The number of neighbours per point, including the point itself.
+    dims : int, optional
+        The number of coordinates taken into account.
+    workers : int, optional
+        The number of threads used for the query.
+        If -1, all available threads are used.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray]
+        The distances and the indices of the neighbours, sorted by distance.
+        Both arrays have shape ``(n, nmax)``.
+
+    """
+    cloud = asarray(cloud, dtype=float)[:, :dims]
+    tree = cKDTree(cloud)
+    distances, indices = tree.query(cloud, nmax, workers=workers)
+    return distances.reshape((len(cloud), -1)), indices.reshape((len(cloud), -1))
+
+
+def find_neighbours_in_radius_numpy(cloud, radius, dims=3, workers=-1):
+    """Find all neighbours within a radius of all points of a cloud with a single query of a KD tree.
+
+    Parameters
+    ----------
+    cloud : list[[float, float, float]] | numpy.ndarray
+        The points of the cloud.
+    radius : float
+        The search radius.
+    dims : int, optional
+        The number of coordinates taken into account.
+    workers : int, optional
+        The number of threads used for the query.
+        If -1, all available threads are used.
+
+    Returns
+    -------
+    list[list[int]]
+        The sorted indices of the neighbours of every point, including the point itself.
+
+    """
+    cloud = asarray(cloud, dtype=float)[:, :dims]
+    tree = cKDTree(cloud)
+    return tree.query_ball_point(cloud, radius, workers=workers, return_sorted=True).tolist()
+
+
+def find_neighbour_pairs_numpy(cloud, radius, dims=3):
+    """Find all pairs of points of a cloud that are within a radius of each other.
+
+    Parameters
+    ----------
+    cloud : list[[float, float, float]] | numpy.ndarray
+        The points of the cloud.
+    radius : float
+        The search radius.
+    dims : int, optional
+        The number of coordinates taken into account.
+
+    Returns
+    -------
+    numpy.ndarray
+        The index pairs ``(i, j)``, with ``i < j``, as an array of shape ``(m, 2)``.
+
+    """
+    cloud = asarray(cloud, dtype=float)[:, :dims]
     tree = cKDTree(cloud)
-    nnbrs = [tree.query(root, nmax) for root in cloud]
-    nnbrs = [(d.flatten().tolist(), n.flatten().tolist()) for d, n in nnbrs]
-    return nnbrs
+    return tree.query_pairs(radius, output_type="ndarray")
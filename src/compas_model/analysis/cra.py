@@ -20,8 +20,10 @@ def cra_penalty_solve(
     element_block = {}
 
     for element in model.elements():
+        # the solver only accepts compas_assembly blocks, so the geometry is still copied,
+        # but the centroid is read from the cached face geometry instead of the copy
         block: Block = element.geometry.copy(cls=Block)
-        x, y, z = block.centroid()
+        x, y, z = element.geometry.centroid()
         node = assembly.add_block(block, x=x, y=y, z=z, is_support=element.is_support)
         element_block[element.graph_node] = node
 
@@ -3,11 +3,14 @@ from compas.datastructures import Mesh
 from compas.geometry import Box
 from compas.geometry import Frame
 from compas.geometry import Point
+from compas.geometry import Polygon
+from compas.geometry import area_polygon
 from compas.geometry import bounding_box
 from compas.geometry import centroid_points
+from compas.geometry import centroid_polygon
 from compas.geometry import centroid_polyhedron
 from compas.geometry import cross_vectors
-from compas.geometry import dot_vectors
+from compas.geometry import normal_polygon
 from compas.geometry import oriented_bounding_box
 from compas.geometry import volume_polyhedron
 
@@ -15,7 +18,175 @@ from compas_model.elements import Element
 from compas_model.elements import Feature
 
 
+class BlockFaceGeometry(object):
+    """Array-backed per-face geometry of a block.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        The mesh of the block.
+
+    Attributes
+    ----------
+    faces : list[int]
+        The face identifiers, in the order of the arrays.
+    face_index : dict[int, int]
+        A mapping from face identifiers to array indices.
+    vertices : numpy.ndarray
+        The vertex coordinates, with shape ``(v, 3)``.
+    face_vertices : list[list[int]]
+        The indices of the vertices of every face in the vertex array.
+    frames : list[:class:`compas.geometry.Frame`]
+        The frames of the faces, as computed by :meth:`BlockGeometry.frame`.
+    centers : numpy.ndarray
+        The centers of the faces, which are the origins of the frames, with shape ``(f, 3)``.
+    normals : numpy.ndarray
+        The unit normals of the faces, with shape ``(f, 3)``.
+    xaxes : numpy.ndarray
+        The X axes of the frames, with shape ``(f, 3)``.
+    yaxes : numpy.ndarray
+        The Y axes of the frames, with shape ``(f, 3)``.
+    zaxes : numpy.ndarray
+        The Z axes of the frames, with shape ``(f, 3)``.
+    areas : numpy.ndarray
+        The areas of the faces, with shape ``(f,)``.
+    offsets : numpy.ndarray
+        The offsets of the face planes from the origin along the normals, with shape ``(f,)``.
+
+    """
+
+    def __init__(self, mesh):
+        # type: (Mesh) -> None
+        from numpy import array
+        from numpy import einsum
+
+        vertex_index = {vertex: index for index, vertex in enumerate(mesh.vertices())}
+
+        self.faces = list(mesh.faces())
+        self.face_index = {face: index for index, face in enumerate(self.faces)}
+        self.vertices = array(mesh.vertices_attributes("xyz"), dtype=float).reshape((-1, 3))
+        self.face_vertices = [[vertex_index[vertex] for vertex in mesh.face_vertices(face)] for face in self.faces]
+
+        frames = []
+        normals = []
+        areas = []
+        for face in self.faces:
+            xyz = mesh.face_coordinates(face)
+            frames.append(self.face_frame(xyz))
+            normals.append(normal_polygon(xyz))
+            areas.append(area_polygon(xyz))
+
+        self.frames = frames
+        self.centers = array([frame.point for frame in frames], dtype=float).reshape((-1, 3))
+        self.normals = array(normals, dtype=float).reshape((-1, 3))
+        self.xaxes = array([frame.xaxis for frame in frames], dtype=float).reshape((-1, 3))
+        self.yaxes = array([frame.yaxis for frame in frames], dtype=float).reshape((-1, 3))
+        self.zaxes = array([frame.zaxis for frame in frames], dtype=float).reshape((-1, 3))
+        self.areas = array(areas, dtype=float)
+        self.offsets = einsum("ij,ij->i", self.normals, self.centers)
+
+    @staticmethod
+    def face_frame(xyz):
+        # type: (list[list[float]]) -> Frame
+        """Compute the frame of a face from the coordinates of its corners.
+
+        Parameters
+        ----------
+        xyz : list[list[float]]
+            The corner coordinates of the face.
+
+        Returns
+        -------
+        :class:`compas.geometry.Frame`
+            A frame at the centroid of the face, with the X axis along the first edge.
+
+        """
+        o = centroid_polygon(xyz)
+        w = normal_polygon(xyz)
+        u = [xyz[1][i] - xyz[0][i] for i in range(3)]  # align with longest edge instead?
+        v = cross_vectors(w, u)
+        return Frame(o, u, v)
+
+
 class BlockGeometry(Mesh):
+    """Mesh representing the geometry of a block, with cached per-face geometry.
+
+    Attributes
+    ----------
+    facegeometry : :class:`BlockFaceGeometry`, read-only
+        The cached per-face geometry of the block.
+        The cached data is recomputed when the vertex coordinates or the faces of the mesh
+        are changed through the mesh API.
+        Modifications of the underlying vertex and face dicts are not detected.
+
+    """
+
+    _facegeometry = None
+    _facegeometry_cache = None
+
+    @property
+    def facegeometry(self):
+        # type: () -> BlockFaceGeometry
+        if self._facegeometry is None:
+            self._facegeometry = BlockFaceGeometry(self)
+            self._facegeometry_cache = {}
+        return self._facegeometry
+
+    def _invalidate_facegeometry(self):
+        # type: () -> None
+        self._facegeometry = None
+        self._facegeometry_cache = None
+
+    # =============================================================================
+    # Mesh modifiers that invalidate the face geometry
+    # =============================================================================
+
+    def vertex_attribute(self, key, name, value=None):
+        if value is not None and name in ("x", "y", "z"):
+            self._invalidate_facegeometry()
+        return super(BlockGeometry, self).vertex_attribute(key, name, value=value)
+
+    def vertex_attributes(self, key, names=None, values=None):
+        if names and values is not None and any(name in ("x", "y", "z") for name in names):
+            self._invalidate_facegeometry()
+        return super(BlockGeometry, self).vertex_attributes(key, names=names, values=values)
+
+    def add_vertex(self, *args, **kwargs):
+        self._invalidate_facegeometry()
+        return super(BlockGeometry, self).add_vertex(*args, **kwargs)
+
+    def add_face(self, *args, **kwargs):
+        self._invalidate_facegeometry()
+        return super(BlockGeometry, self).add_face(*args, **kwargs)
+
+    def delete_vertex(self, key):
+        self._invalidate_facegeometry()
+        return super(BlockGeometry, self).delete_vertex(key)
+
+    def delete_face(self, fkey):
+        self._invalidate_facegeometry()
+        return super(BlockGeometry, self).delete_face(fkey)
+
+    def flip_cycles(self):
+        self._invalidate_facegeometry()
+        return super(BlockGeometry, self).flip_cycles()
+
+    def unify_cycles(self, *args, **kwargs):
+        self._invalidate_facegeometry()
+        return super(BlockGeometry, self).unify_cycles(*args, **kwargs)
+
+    def clear(self):
+        self._invalidate_facegeometry()
+        return super(BlockGeometry, self).clear()
+
+    def transform(self, T):
+        super(BlockGeometry, self).transform(T)
+        self._invalidate_facegeometry()
+
+    # =============================================================================
+    # Block methods
+    # =============================================================================
+
     def centroid(self):
         """Compute the centroid of the block.
 
@@ -24,7 +195,10 @@ class BlockGeometry(Mesh):
         :class:`compas.geometry.Point`
 
         """
-        x, y, z = centroid_points([self.vertex_coordinates(key) for key in self.vertices()])
+        facegeometry = self.facegeometry
+        if "centroid" not in self._facegeometry_cache:
+            self._facegeometry_cache["centroid"] = centroid_points(facegeometry.vertices.tolist())
+        x, y, z = self._facegeometry_cache["centroid"]
         return Point(x, y, z)
 
     def frames(self):
@@ -36,7 +210,8 @@ class BlockGeometry(Mesh):
             A dictionary mapping face identifiers to face frames.
 
         """
-        return {face: self.frame(face) for face in self.faces()}
+        facegeometry = self.facegeometry
+        return {face: Frame(frame.point, frame.xaxis, frame.yaxis) for face, frame in zip(facegeometry.faces, facegeometry.frames)}
 
     def frame(self, face):
         """Compute the frame of a specific face.
@@ -51,12 +226,9 @@ class BlockGeometry(Mesh):
         :class:`compas.geometry.Frame`
 
         """
-        xyz = self.face_coordinates(face)
-        o = self.face_center(face)
-        w = self.face_normal(face)
-        u = [xyz[1][i] - xyz[0][i] for i in range(3)]  # align with longest edge instead?
-        v = cross_vectors(w, u)
-        return Frame(o, u, v)
+        facegeometry = self.facegeometry
+        frame = facegeometry.frames[facegeometry.face_index[face]]
+        return Frame(frame.point, frame.xaxis, frame.yaxis)
 
     def top(self):
         """Identify the *top* face of the block.
@@ -67,10 +239,12 @@ class BlockGeometry(Mesh):
             The identifier of the face.
 
         """
-        z = [0, 0, 1]
-        faces = list(self.faces())
-        normals = [self.face_normal(face) for face in faces]
-        return sorted(zip(faces, normals), key=lambda x: dot_vectors(x[1], z))[-1][0]
+        from numpy import argmax
+
+        facegeometry = self.facegeometry
+        # the last face with the highest normal Z component
+        z = facegeometry.normals[::-1, 2]
+        return facegeometry.faces[len(z) - 1 - int(argmax(z))]
 
     def center(self):
         """Compute the center of mass of the block.
@@ -80,10 +254,10 @@ class BlockGeometry(Mesh):
         :class:`compas.geometry.Point`
 
         """
-        vertex_index = {vertex: index for index, vertex in enumerate(self.vertices())}
-        vertices = [self.vertex_coordinates(vertex) for vertex in self.vertices()]
-        faces = [[vertex_index[vertex] for vertex in self.face_vertices(face)] for face in self.faces()]
-        x, y, z = centroid_polyhedron((vertices, faces))
+        facegeometry = self.facegeometry
+        if "center" not in self._facegeometry_cache:
+            self._facegeometry_cache["center"] = centroid_polyhedron((facegeometry.vertices.tolist(), facegeometry.face_vertices))
+        x, y, z = self._facegeometry_cache["center"]
         return Point(x, y, z)
 
     def volume(self):
@@ -95,11 +269,10 @@ class BlockGeometry(Mesh):
             The volume of the block.
 
         """
-        vertex_index = {vertex: index for index, vertex in enumerate(self.vertices())}
-        vertices = [self.vertex_coordinates(vertex) for vertex in self.vertices()]
-        faces = [[vertex_index[vertex] for vertex in self.face_vertices(face)] for face in self.faces()]
-        v = volume_polyhedron((vertices, faces))
-        return v
+        facegeometry = self.facegeometry
+        if "volume" not in self._facegeometry_cache:
+            self._facegeometry_cache["volume"] = volume_polyhedron((facegeometry.vertices.tolist(), facegeometry.face_vertices))
+        return self._facegeometry_cache["volume"]
 
 
 # A block could have features like notches,
@@ -118,6 +291,8 @@ class BlockElement(Element):
     ----------
     shape : :class:`compas.datastructures.Mesh`
         The base shape of the block.
+        A shape of type :class:`BlockGeometry` is shared with other blocks constructed with the same shape.
+        Other meshes are copied.
     features : list[:class:`BlockFeature`], optional
         Additional block features.
     is_support : bool, optional
@@ -160,23 +335,18 @@ class BlockElement(Element):
     @property
     def face_polygons(self):
         # type: () -> list[compas.geometry.Polygon]
-        return [self.geometry.face_polygon(face) for face in self.geometry.faces()]  # type: ignore
+        facegeometry = self.geometry.facegeometry  # type: ignore
+        return [Polygon(facegeometry.vertices[vertices].tolist()) for vertices in facegeometry.face_vertices]
 
     # =============================================================================
     # Implementations of abstract methods
     # =============================================================================
 
     def compute_geometry(self, include_features=False):
-        geometry = self.shape
-        if include_features:
-            if self.features:
-                for feature in self.features:
-                    geometry = feature.apply(geometry)
-        geometry.transform(self.worldtransformation)
-        return geometry
+        return self._compute_mesh_geometry(include_features)
 
     def compute_aabb(self, inflate=0.0):
-        points = self.geometry.vertices_attributes("xyz")  # type: ignore
+        points = self.worldvertices.tolist()
         box = Box.from_bounding_box(bounding_box(points))
         box.xsize += inflate
         box.ysize += inflate
@@ -184,7 +354,7 @@ class BlockElement(Element):
         return box
 
     def compute_obb(self, inflate=0.0):
-        points = self.geometry.vertices_attributes("xyz")  # type: ignore
+        points = self.worldvertices.tolist()
         box = Box.from_bounding_box(oriented_bounding_box(points))
         box.xsize += inflate
         box.ysize += inflate
@@ -195,9 +365,9 @@ class BlockElement(Element):
         # TODO: (TvM) make this a pluggable with default implementation in core and move import to top
         from compas.geometry import convex_hull_numpy
 
-        points = self.geometry.vertices_attributes("xyz")  # type: ignore
+        points = self.worldvertices
         vertices, faces = convex_hull_numpy(points)
-        vertices = [points[index] for index in vertices]  # type: ignore
+        vertices = points[vertices].tolist()
         return Mesh.from_vertices_and_faces(vertices, faces)
 
     # =============================================================================
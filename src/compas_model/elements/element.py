@@ -4,6 +4,8 @@ if not compas.IPY:
     from typing import TYPE_CHECKING
 
     if TYPE_CHECKING:
+        import numpy  # noqa: F401
+
         from compas_model.models import ElementNode  # noqa: F401
 
 from functools import reduce
@@ -13,6 +15,8 @@ from operator import mul
 import compas.datastructures  # noqa: F401
 import compas.geometry
 from compas.data import Data
+from compas.geometry import Box
+from compas.geometry import Frame
 from compas.geometry import Transformation
 
 
@@ -24,11 +28,20 @@ def reset_computed(f):
         self._obb = None
         self._collision_mesh = None
         self._geometry = None
+        self._worldvertices = None
         return f(*args, **kwargs)
 
     return wrapper
 
 
+def _inflated_box(box, inflate):
+    # type: (compas.geometry.Box, float) -> compas.geometry.Box
+    if not inflate:
+        return box
+    frame = Frame(box.frame.point, box.frame.xaxis, box.frame.yaxis)
+    return Box(box.xsize + inflate, box.ysize + inflate, box.zsize + inflate, frame=frame)
+
+
 class Feature(Data):
     """Base class for all element features.
 
@@ -75,6 +88,8 @@ class Element(Data):
         The local coordinate frame of the element.
     geometry : :class:`compas.datastructures.Mesh` | :class:`compas.geometry.Brep`, readonly
         The geometry of the element, computed from the base shape and its features.
+    worldvertices : numpy.ndarray, readonly
+        The coordinates of the vertices of the base shape of the element in world coordinates.
     aabb : :class:`compas.geometry.Box`, readonly
         The Axis Aligned Bounding Box (AABB) of the element.
     obb : :class:`compas.geometry.Box`, readonly
@@ -112,6 +127,7 @@ class Element(Data):
         self._obb = None
         self._collision_mesh = None
         self._geometry = geometry
+        self._worldvertices = None
         self._frame = frame
         self._transformation = transformation
         self._worldtransformation = None
@@ -133,12 +149,9 @@ class Element(Data):
 
     @frame.setter
     def frame(self, frame):
-        self._worldtransformation = None
-        self._aabb = None
-        self._obb = None
-        self._collision_mesh = None
-        self._geometry = None
         self._frame = frame
+        self._reset_computed()
+        self._mark_modified()
 
     @property
     def transformation(self):
@@ -147,16 +160,32 @@ class Element(Data):
 
     @transformation.setter
     def transformation(self, transformation):
+        self._transformation = transformation
+        self._reset_computed()
+        self._mark_modified()
+
+    @property
+    def material(self):
+        return self._material
+
+    def _reset_computed(self):
+        # type: () -> None
+        # the computed attributes are recomputed lazily, the next time they are accessed
         self._worldtransformation = None
         self._aabb = None
         self._obb = None
         self._collision_mesh = None
         self._geometry = None
-        self._transformation = transformation
+        self._worldvertices = None
 
-    @property
-    def material(self):
-        return self._material
+    def _mark_modified(self):
+        # type: () -> None
+        # let the element tree of the parent model know that the element moved,
+        # such that collisions and interactions can be updated incrementally
+        if self.tree_node:
+            tree = self.tree_node.tree
+            if tree:
+                tree.mark_modified(self)
 
     # ==========================================================================
     # Computed attributes
@@ -174,6 +203,13 @@ class Element(Data):
             self._geometry = self.compute_geometry()
         return self._geometry
 
+    @property
+    def worldvertices(self):
+        # type: () -> numpy.ndarray
+        if self._worldvertices is None:
+            self._worldvertices = self.compute_worldvertices()
+        return self._worldvertices
+
     @property
     def aabb(self):
         # type: () -> compas.geometry.Box
@@ -188,6 +224,48 @@ class Element(Data):
             self._obb = self.compute_obb()
         return self._obb
 
+    def get_aabb(self, inflate=0.0):
+        # type: (float) -> compas.geometry.Box
+        """Get the Axis Aligned Bounding Box (AABB) of the element, inflated by a given offset.
+
+        Parameters
+        ----------
+        inflate : float, optional
+            Offset of box to avoid floating point errors.
+
+        Returns
+        -------
+        :class:`compas.geometry.Box`
+
+        Notes
+        -----
+        The box is derived from the cached AABB of the element.
+        The AABB itself is computed only once, regardless of the inflation.
+
+        """
+        return _inflated_box(self.aabb, inflate)
+
+    def get_obb(self, inflate=0.0):
+        # type: (float) -> compas.geometry.Box
+        """Get the Oriented Bounding Box (OBB) of the element, inflated by a given offset.
+
+        Parameters
+        ----------
+        inflate : float, optional
+            Offset of box to avoid floating point errors.
+
+        Returns
+        -------
+        :class:`compas.geometry.Box`
+
+        Notes
+        -----
+        The box is derived from the cached OBB of the element.
+        The OBB itself is computed only once, regardless of the inflation.
+
+        """
+        return _inflated_box(self.obb, inflate)
+
     @property
     def dimensions(self):
         # type: () -> tuple[float, float, float]
@@ -226,7 +304,8 @@ class Element(Data):
         # the parent of an element node is always a group node
         # the parent of a group node is always another group node
         # group nodes can have a frame that serves as a reference frame for its descendants
-        parent = self.tree_node.parent  # type: ignore
+        # elements that are not part of a model have no parent
+        parent = self.tree_node.parent if self.tree_node else None
 
         while parent:
             if parent.frame:
@@ -245,6 +324,47 @@ class Element(Data):
 
         return worldtransformation
 
+    def compute_worldvertices(self):
+        # type: () -> numpy.ndarray
+        """Compute the coordinates of the vertices of the base shape of the element in world coordinates.
+
+        Returns
+        -------
+        numpy.ndarray
+            The world coordinates of the vertices, as an array of shape ``(n, 3)``.
+
+        Raises
+        ------
+        NotImplementedError
+            If the base shape of the element is not a mesh.
+
+        Notes
+        -----
+        The base shape itself is never transformed.
+        The world coordinates are computed with a single matrix multiplication,
+        and are shared by the geometry, the bounding boxes and the collision mesh of the element.
+
+        """
+        from compas.geometry import transform_points_numpy
+
+        shape = getattr(self, "shape", None)
+        if not isinstance(shape, compas.datastructures.Mesh):
+            raise NotImplementedError
+        return transform_points_numpy(shape.vertices_attributes("xyz"), self.worldtransformation).reshape((-1, 3))
+
+    def _compute_mesh_geometry(self, include_features=False):
+        # type: (bool) -> compas.datastructures.Mesh
+        # the shape is shared with other elements and should never be transformed in place
+        geometry = self.shape.copy()
+        if include_features and self.features:
+            for feature in self.features:
+                geometry = feature.apply(geometry)
+            geometry.transform(self.worldtransformation)
+            return geometry
+        for vertex, xyz in zip(geometry.vertices(), self.worldvertices.tolist()):
+            geometry.vertex_attributes(vertex, "xyz", xyz)
+        return geometry
+
     def compute_geometry(self, include_features=False):
         # type: (bool) -> compas.datastructures.Mesh | compas.geometry.Brep
         """Compute the geometry of the element.
@@ -67,16 +67,10 @@ class InterfaceElement(Element):
     # =============================================================================
 
     def compute_geometry(self, include_features=False):
-        geometry = self.shape
-        if include_features:
-            if self.features:
-                for feature in self.features:
-                    geometry = feature.apply(geometry)
-        geometry.transform(self.worldtransformation)
-        return geometry
+        return self._compute_mesh_geometry(include_features)
 
     def compute_aabb(self, inflate=0.0):
-        points = self.geometry.vertices_attributes("xyz")  # type: ignore
+        points = self.worldvertices.tolist()
         box = Box.from_bounding_box(bounding_box(points))
         box.xsize += inflate
         box.ysize += inflate
@@ -84,7 +78,7 @@ class InterfaceElement(Element):
         return box
 
     def compute_obb(self, inflate=0.0):
-        points = self.geometry.vertices_attributes("xyz")  # type: ignore
+        points = self.worldvertices.tolist()
         box = Box.from_bounding_box(oriented_bounding_box(points))
         box.xsize += inflate
         box.ysize += inflate
@@ -95,7 +89,7 @@ class InterfaceElement(Element):
         # TODO: (TvM) make this a pluggable with default implementation in core and move import to top
         from compas.geometry import convex_hull_numpy
 
-        points = self.geometry.vertices_attributes("xyz")  # type: ignore
+        points = self.worldvertices
         vertices, faces = convex_hull_numpy(points)
-        vertices = [points[index] for index in vertices]  # type: ignore
+        vertices = points[vertices].tolist()
         return Mesh.from_vertices_and_faces(vertices, faces)
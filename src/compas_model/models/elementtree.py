@@ -1,3 +1,7 @@
+import uuid
+from collections import OrderedDict
+from typing import Generator  # noqa: F401
+
 from compas.datastructures import Tree
 
 import compas_model.models  # noqa: F401
@@ -22,9 +26,11 @@ class ElementTree(Tree):
     model : :class:`compas_model.model.Model`
         The parent model of the tree.
     groups : list[:class:`GroupNode`], read-only
-        The groups contained in the tree.
+        The groups contained in the tree, in the order in which they were added.
     elements : list[:class:`Element`], read-only
-        The elements contained in the tree
+        The elements contained in the tree, in the order in which they were added.
+    modified_elements : list[:class:`Element`], read-only
+        The elements that were added or moved since the last call to :meth:`clear_modified`.
 
     """
 
@@ -42,18 +48,163 @@ class ElementTree(Tree):
     def __init__(self, model, name=None):
         # type: (compas_model.models.Model, str | None) -> None
         super(ElementTree, self).__init__(name=name)
+        # indexes of the element nodes and group nodes by the guids of their elements and of the groups
+        # which are updated when nodes are added to or removed from group nodes of the tree
+        self._element_nodes = OrderedDict()
+        self._group_nodes = OrderedDict()
+        self._modified = OrderedDict()
         root = GroupNode(name="root")
         self.add(root)
+        self._register(root)
 
     @property
     def groups(self):
         # type: () -> list[GroupNode]
-        return [node for node in self.nodes if isinstance(node, GroupNode)]
+        return list(self._group_nodes.values())
 
     @property
     def elements(self):
         # type: () -> list[Element]
-        return [node.element for node in self.nodes if isinstance(node, ElementNode)]
+        return [node.element for node in self._element_nodes.values()]
+
+    @property
+    def modified_elements(self):
+        # type: () -> list[Element]
+        return list(self._modified.values())
+
+    def mark_modified(self, element):
+        # type: (Element) -> None
+        """Mark an element as modified, for incremental updates of collisions and interactions.
+
+        Parameters
+        ----------
+        element : :class:`compas_model.elements.Element`
+
+        Returns
+        -------
+        None
+
+        """
+        self._modified[element.guid] = element
+        if element.tree_node:
+            self._invalidate_ancestors(element.tree_node)
+
+    def unmark_modified(self, element):
+        # type: (Element) -> None
+        """Remove the modified mark of an element.
+
+        Parameters
+        ----------
+        element : :class:`compas_model.elements.Element`
+
+        Returns
+        -------
+        None
+
+        """
+        self._modified.pop(element.guid, None)
+
+    def clear_modified(self):
+        # type: () -> None
+        """Remove the modified mark of all elements.
+
+        Returns
+        -------
+        None
+
+        """
+        self._modified.clear()
+
+    def invalidate(self, node):
+        # type: (GroupNode | ElementNode) -> None
+        """Invalidate the computed attributes of all elements in the subtree of a node.
+
+        Parameters
+        ----------
+        node : :class:`GroupNode` | :class:`ElementNode`
+            The root of the subtree.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        The world transformation, geometry, bounding boxes and collision mesh of the affected elements
+        are recomputed lazily, the next time they are accessed.
+        The affected elements are marked as modified,
+        and the bounding boxes of the groups in the subtree and of the ancestors of the subtree are invalidated.
+        The computed attributes of all other elements and groups are not affected.
+
+        """
+        self._invalidate_subtree(node)
+        self._invalidate_ancestors(node)
+
+    def _invalidate_subtree(self, node):
+        # type: (GroupNode | ElementNode) -> None
+        if isinstance(node, ElementNode):
+            node.element._reset_computed()
+            self._modified[node.element.guid] = node.element
+            return
+        for child in node.traverse():
+            if isinstance(child, ElementNode):
+                child.element._reset_computed()
+                self._modified[child.element.guid] = child.element
+            else:
+                child._aabb = None
+                child._has_aabb = False
+
+    def _invalidate_ancestors(self, node):
+        # type: (GroupNode | ElementNode) -> None
+        # the box of a group can only be cached if the boxes of all its descendant groups are cached
+        # therefore, the traversal can stop at the first ancestor without a cached box
+        parent = node.parent
+        while parent and parent._has_aabb:
+            parent._aabb = None
+            parent._has_aabb = False
+            parent = parent.parent
+
+    def _register(self, node):
+        # type: (GroupNode | ElementNode) -> None
+        if isinstance(node, ElementNode):
+            self._element_nodes[node.element.guid] = node
+            return
+        for child in node.traverse():
+            if isinstance(child, ElementNode):
+                self._element_nodes[child.element.guid] = child
+            else:
+                self._group_nodes[child.guid] = child
+
+    def _unregister(self, node):
+        # type: (GroupNode | ElementNode) -> None
+        for child in node.traverse():
+            if isinstance(child, ElementNode):
+                self._element_nodes.pop(child.element.guid, None)
+                self._modified.pop(child.element.guid, None)
+            else:
+                self._group_nodes.pop(child.guid, None)
+
+    def element_nodes(self):
+        # type: () -> Generator[ElementNode, None, None]
+        """Yield the element nodes of the tree, without traversing the tree.
+
+        Yields
+        ------
+        :class:`ElementNode`
+
+        """
+        return iter(self._element_nodes.values())
+
+    def group_nodes(self):
+        # type: () -> Generator[GroupNode, None, None]
+        """Yield the group nodes of the tree, without traversing the tree.
+
+        Yields
+        ------
+        :class:`GroupNode`
+
+        """
+        return iter(self._group_nodes.values())
 
     def find_element_node(self, element):
         # type: (Element) -> ElementNode
@@ -73,8 +224,33 @@ class ElementTree(Tree):
             If the element is not in the tree.
 
         """
-        for node in self.nodes:
-            if isinstance(node, ElementNode):
-                if node.element is element:
-                    return node
-        raise ValueError("Element not in tree")
+        node = self._element_nodes.get(element.guid)
+        if node is None or node.element is not element:
+            raise ValueError("Element not in tree")
+        return node
+
+    def find_group_node(self, guid):
+        # type: (str | uuid.UUID) -> GroupNode
+        """Find a group node by its guid.
+
+        Parameters
+        ----------
+        guid : str | :class:`uuid.UUID`
+            The guid of the group node.
+
+        Returns
+        -------
+        :class:`compas_model.model.GroupNode`
+
+        Raises
+        ------
+        ValueError
+            If the group is not in the tree.
+
+        """
+        if not isinstance(guid, uuid.UUID):
+            guid = uuid.UUID(guid)
+        node = self._group_nodes.get(guid)
+        if node is None:
+            raise ValueError("Group not in tree")
+        return node
@@ -1,5 +1,7 @@
 import compas.geometry  # noqa: F401
 from compas.datastructures import TreeNode
+from compas.geometry import Box
+from compas.geometry import bounding_box
 
 from .elementnode import ElementNode  # noqa: F401
 
@@ -18,6 +20,15 @@ class GroupNode(TreeNode):
     name : str
         The name of the group node.
 
+    Attributes
+    ----------
+    frame : :class:`compas.geometry.Frame` | None
+        The reference frame of the descendants of the group.
+        Changing the frame invalidates the computed attributes of all descendant elements.
+    aabb : :class:`compas.geometry.Box` | None, read-only
+        The Axis Aligned Bounding Box (AABB) of all descendant elements,
+        or None if the group has no descendant elements.
+
     """
 
     DATASCHEMA = {
@@ -56,6 +67,97 @@ class GroupNode(TreeNode):
         attr["name"] = name
         super(GroupNode, self).__init__(**attr)
         self._frame = frame
+        self._aabb = None
+        # the box of an empty group is None, therefore it is not an indication of a missing box
+        self._has_aabb = False
+
+    def add(self, node):
+        # type: (GroupNode | ElementNode) -> None
+        """Add a child node to this group node.
+
+        Parameters
+        ----------
+        node : :class:`GroupNode` | :class:`ElementNode`
+            The node to add.
+
+        Returns
+        -------
+        None
+
+
+        Notes
+        -----
+        The computed attributes of the elements in the subtree of the node,
+        and the bounding boxes of this group and its ancestors, are invalidated.
+
+        """
+        super(GroupNode, self).add(node)
+        tree = self.tree
+        if tree:
+            tree._register(node)
+            tree.invalidate(node)
+
+    def add_nodes(self, nodes):
+        # type: (list[GroupNode | ElementNode]) -> None
+        """Add multiple child nodes to this group node at once.
+
+        Parameters
+        ----------
+        nodes : list[:class:`GroupNode` | :class:`ElementNode`]
+            The nodes to add.
+
+        Returns
+        -------
+        None
+
+
+        Notes
+        -----
+        The nodes are invalidated as in :meth:`add`.
+
+        """
+        children = set(id(child) for child in self._children)
+        tree = self.tree
+        for node in nodes:
+            if id(node) not in children:
+                children.add(id(node))
+                self._children.append(node)
+            node._parent = self
+            if tree:
+                tree._register(node)
+                tree._invalidate_subtree(node)
+        if tree and nodes:
+            # the nodes have the same ancestors
+            tree._invalidate_ancestors(nodes[0])
+
+    def remove(self, node):
+        # type: (GroupNode | ElementNode) -> None
+        """Remove a child node from this group node.
+
+        Parameters
+        ----------
+        node : :class:`GroupNode` | :class:`ElementNode`
+            The node to remove.
+
+        Returns
+        -------
+        None
+
+
+        Notes
+        -----
+        The computed attributes of the elements in the subtree of the node,
+        and the bounding boxes of this group and its ancestors, are invalidated.
+
+        """
+        tree = self.tree
+        if tree:
+            # the subtree is invalidated while it is still attached,
+            # such that this group and its ancestors are invalidated as well
+            tree.invalidate(node)
+        super(GroupNode, self).remove(node)
+        if tree:
+            tree._unregister(node)
 
     def __getitem__(self, index):
         # type: (int) -> GroupNode | ElementNode
@@ -69,3 +171,44 @@ class GroupNode(TreeNode):
     @frame.setter
     def frame(self, frame):
         self._frame = frame
+        tree = self.tree
+        if tree:
+            tree.invalidate(self)
+
+    @property
+    def aabb(self):
+        # type: () -> compas.geometry.Box | None
+        if not self._has_aabb:
+            self._aabb = self.compute_aabb()
+            self._has_aabb = True
+        return self._aabb
+
+    def compute_aabb(self):
+        # type: () -> compas.geometry.Box | None
+        """Compute the Axis Aligned Bounding Box (AABB) of all descendant elements.
+
+        Returns
+        -------
+        :class:`compas.geometry.Box` | None
+
+        Notes
+        -----
+        The box is computed from the (cached) boxes of the children of the group.
+        When an element changes, only the boxes of its ancestor groups are recomputed.
+        Elements that do not implement :meth:`compas_model.elements.Element.compute_aabb` are skipped.
+
+        """
+        points = []
+        for child in self.children:
+            if isinstance(child, GroupNode):
+                box = child.aabb
+            else:
+                try:
+                    box = child.element.aabb
+                except NotImplementedError:
+                    continue
+            if box:
+                points += box.points
+        if not points:
+            return None
+        return Box.from_bounding_box(bounding_box(points))
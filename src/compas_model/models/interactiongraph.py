@@ -1,4 +1,6 @@
 from typing import Generator  # noqa: F401
+from typing import Iterable  # noqa: F401
+from typing import Type  # noqa: F401
 
 from compas.datastructures import Graph
 
@@ -68,6 +70,12 @@ class InteractionGraph(Graph):
         )
         self.update_default_node_attributes(element=None)
         self.update_default_edge_attributes(interactions=None)
+        # an index of the stored edges by their canonical, undirected key
+        self._edge_index = {}
+        # an index of the edges by the types of their interactions,
+        # and the cached connected components per interaction type
+        self._type_edges = {}
+        self._components = {}
 
     def __str__(self):
         # type: () -> str
@@ -82,17 +90,296 @@ class InteractionGraph(Graph):
         for node in self.nodes():
             lines.append("{}".format(node))
             for nbr in self.neighbors(node):
-                edge = node, nbr
-                if not self.has_edge(edge):
-                    edge = nbr, node
                 lines.append(
                     "- {}: {}".format(
                         nbr,
-                        self.edge_interactions(edge),  # type: ignore
+                        self.edge_interactions(node, nbr),  # type: ignore
                     )  # type: ignore
                 )
         return "\n".join(lines) + "\n"
 
+    # =============================================================================
+    # Undirected edge index
+    # =============================================================================
+
+    @staticmethod
+    def _edge_key(u, v):
+        # type: (int, int) -> frozenset[int]
+        # the key does not require the nodes to be comparable,
+        # for lookups with nodes that are not part of the graph (None)
+        return frozenset((u, v))
+
+    def add_edge(self, u, v, attr_dict=None, **kwattr):
+        # type: (int, int, dict | None, dict) -> tuple[int, int]
+        edge = super(InteractionGraph, self).add_edge(u, v, attr_dict=attr_dict, **kwattr)
+        self._edge_index.setdefault(self._edge_key(u, v), edge)
+        self._index_edge_types(u, v)
+        return edge
+
+    def delete_edge(self, edge):
+        # type: (tuple[int, int]) -> None
+        u, v = edge
+        super(InteractionGraph, self).delete_edge(edge)
+        key = self._edge_key(u, v)
+        if self._edge_index.get(key) == (u, v):
+            # an edge in the opposite direction may still exist
+            if u in self.edge.get(v, ()):
+                self._edge_index[key] = v, u
+            else:
+                del self._edge_index[key]
+        self._index_edge_types(u, v)
+
+    def delete_node(self, key):
+        # type: (int) -> None
+        # only the edges of the neighbours of the node are visited,
+        # instead of all edges of the graph
+        for nbr in list(self.adjacency.get(key, ())):
+            self._edge_index.pop(self._edge_key(key, nbr), None)
+            self._unindex_edge_types(self._edge_key(key, nbr))
+            self.edge.get(nbr, {}).pop(key, None)
+            self.adjacency.get(nbr, {}).pop(key, None)
+        self.edge.pop(key, None)
+        self.adjacency.pop(key, None)
+        self.node.pop(key, None)
+        self._components = {}
+
+    def clear_edges(self):
+        # type: () -> None
+        """Remove all edges from the graph.
+
+        Returns
+        -------
+        None
+
+        """
+        self.edge = {node: {} for node in self.node}
+        self.adjacency = {node: {} for node in self.node}
+        self._edge_index = {}
+        self._type_edges = {}
+        self._components = {}
+
+    def edge_attribute(self, key, name, value=None):
+        result = super(InteractionGraph, self).edge_attribute(key, name, value=value)
+        if value is not None and name == "interactions":
+            self._index_edge_types(*key)
+        return result
+
+    # =============================================================================
+    # Interaction type index
+    # =============================================================================
+
+    def _index_edge_types(self, u, v):
+        # type: (int, int) -> None
+        # (re)index the types of the interactions on the edges between two nodes, in both directions
+        key = self._edge_key(u, v)
+        self._unindex_edge_types(key)
+        for a, b in ((u, v), (v, u)):
+            if b in self.edge.get(a, ()):
+                for interaction in self.edge[a][b].get("interactions") or []:
+                    self._type_edges.setdefault(type(interaction), set()).add(key)
+
+    def _unindex_edge_types(self, key):
+        # type: (frozenset[int]) -> None
+        # the number of interaction types is small,
+        # therefore the types of an edge are not stored per edge, but found by checking all types
+        for interaction_type in list(self._type_edges):
+            edges = self._type_edges[interaction_type]
+            edges.discard(key)
+            if not edges:
+                del self._type_edges[interaction_type]
+        self._components = {}
+
+    def interaction_edges(self, interaction_type):
+        # type: (Type[Interaction]) -> list[tuple[int, int]]
+        """Get the edges with at least one interaction of a specific type.
+
+        Parameters
+        ----------
+        interaction_type : Type[:class:`compas_model.interactions.Interaction`]
+            The type of interaction, including subclasses.
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            The edges, in the direction in which they are stored.
+
+        """
+        keys = set()
+        for edgetype, edges in self._type_edges.items():
+            if issubclass(edgetype, interaction_type):
+                keys.update(edges)
+        return [self._edge_index[key] for key in keys]
+
+    def connected_components(self, interaction_type):
+        # type: (Type[Interaction]) -> list[list[int]]
+        """Find the groups of nodes connected by a specific type of interaction.
+
+        Parameters
+        ----------
+        interaction_type : Type[:class:`compas_model.interactions.Interaction`]
+            The type of interaction, including subclasses.
+
+        Returns
+        -------
+        list[list[int]]
+            The groups of connected nodes.
+            Nodes without interactions of the given type are not included.
+
+        Notes
+        -----
+        The components are computed with union-find over the edges with interactions of the given type,
+        and are cached until the edges or their interactions change.
+        Interactions that are added or removed by modifying the interaction list of an edge in place
+        are not detected.
+        Use :meth:`add_edge_interactions`, or set the interactions with :meth:`edge_attribute`, instead.
+
+        """
+        if interaction_type not in self._components:
+            parent = {}
+
+            def find(node):
+                root = node
+                while parent[root] != root:
+                    root = parent[root]
+                while parent[node] != root:
+                    parent[node], node = root, parent[node]
+                return root
+
+            for u, v in self.interaction_edges(interaction_type):
+                parent.setdefault(u, u)
+                parent.setdefault(v, v)
+                a = find(u)
+                b = find(v)
+                if a != b:
+                    parent[b] = a
+
+            components = {}
+            for node in sorted(parent):
+                components.setdefault(find(node), []).append(node)
+            self._components[interaction_type] = list(components.values())
+
+        return [component[:] for component in self._components[interaction_type]]
+
+    def add_element_nodes(self, elements):
+        # type: (list[Element]) -> list[int]
+        """Add a node for every element in a list, with identifiers from one contiguous range.
+
+        Parameters
+        ----------
+        elements : list[:class:`compas_model.elements.Element`]
+            The elements.
+
+        Returns
+        -------
+        list[int]
+            The identifiers of the nodes.
+
+        """
+        start = self._max_node + 1
+        nodes = list(range(start, start + len(elements)))
+        for node, element in zip(nodes, elements):
+            self.node[node] = {"element": element}
+            self.edge[node] = {}
+            self.adjacency[node] = {}
+        if nodes:
+            self._max_node = nodes[-1]
+        return nodes
+
+    def find_edge(self, u, v):
+        # type: (int, int) -> tuple[int, int] | None
+        """Find the edge between two nodes, regardless of its direction.
+
+        Parameters
+        ----------
+        u : int
+            The identifier of the first node.
+        v : int
+            The identifier of the second node.
+
+        Returns
+        -------
+        tuple[int, int] | None
+            The identifier of the edge, in the direction in which it is stored,
+            or None if the nodes are not connected.
+
+        """
+        return self._edge_index.get(self._edge_key(u, v))
+
+    def add_edge_interactions(self, u, v, interactions):
+        # type: (int, int, list[Interaction]) -> tuple[int, int]
+        """Add interactions to the edge between two nodes, regardless of its direction.
+
+        Parameters
+        ----------
+        u : int
+            The identifier of the first node.
+        v : int
+            The identifier of the second node.
+        interactions : list[:class:`compas_model.interactions.Interaction`]
+            The interactions.
+
+        Returns
+        -------
+        tuple[int, int]
+            The identifier of the edge, in the direction in which it is stored.
+            If the nodes were not connected, a new edge from ``u`` to ``v`` is added.
+
+        """
+        return self._add_edge_interactions(u, v, interactions)
+
+    def add_edges_interactions(self, edges_interactions):
+        # type: (Iterable[tuple[int, int, list[Interaction] | None]]) -> list[tuple[int, int]]
+        """Add interactions to the edges between multiple pairs of nodes, regardless of their direction.
+
+        Parameters
+        ----------
+        edges_interactions : iterable[tuple[int, int, list[:class:`compas_model.interactions.Interaction`] | None]]
+            The pairs of nodes and their interactions.
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            The identifiers of the edges, in the direction in which they are stored.
+
+        Notes
+        -----
+        This is equivalent to calling :meth:`add_edge_interactions` for every pair of nodes.
+        Only the types of the new interactions are added to the index of the edges by interaction type,
+        and the cached connected components are invalidated at most once, if any edge has a new type of interaction.
+
+        """
+        return [self._add_edge_interactions(u, v, interactions) for u, v, interactions in edges_interactions]
+
+    def _add_edge_interactions(self, u, v, interactions):
+        # type: (int, int, list[Interaction] | None) -> tuple[int, int]
+        # only the types of the new interactions are added to the type index
+        # and the cached components are only invalidated if the edge has a type it did not have before
+        # therefore, adding interactions in bulk invalidates the components at most once
+        key = frozenset((u, v))
+        edge = self._edge_index.get(key)
+        if edge is None:
+            edge = u, v
+            self.edge[u][v] = {}
+            self.adjacency[u][v] = None
+            self.adjacency[v][u] = None
+            self._edge_index[key] = edge
+        if not interactions:
+            return edge
+        attr = self.edge[edge[0]][edge[1]]
+        if attr.get("interactions"):
+            attr["interactions"] += interactions
+        else:
+            attr["interactions"] = list(interactions)
+        for interaction in interactions:
+            keys = self._type_edges.get(type(interaction))
+            if keys is None:
+                keys = self._type_edges[type(interaction)] = set()
+            if key not in keys:
+                keys.add(key)
+                if self._components:
+                    self._components = {}
+        return edge
+
     def node_element(self, node):
         # type: (int) -> Element
         """Get the element associated with the node.
@@ -109,21 +396,34 @@ class InteractionGraph(Graph):
         """
         return self.node_attribute(node, "element")  # type: ignore
 
-    def edge_interactions(self, edge):
-        # type: (tuple[int, int]) -> list[Interaction]
-        """Get the element associated with the node.
+    def edge_interactions(self, u, v=None):
+        # type: (tuple[int, int] | int, int | None) -> list[Interaction]
+        """Get the interactions of the edge between two nodes, regardless of its direction.
 
         Parameters
         ----------
-        edge : tuple[int, int]
-            The identifier of the edge.
+        u : tuple[int, int] | int
+            The identifier of the edge, or the identifier of the first node.
+        v : int, optional
+            The identifier of the second node,
+            if the first argument is the identifier of a node.
 
         Returns
         -------
-        :class:`compas_model.interactions.Interaction`
+        list[:class:`compas_model.interactions.Interaction`]
+
+        Raises
+        ------
+        KeyError
+            If the nodes are not connected.
 
         """
-        return self.edge_attribute(edge, "interactions")  # type: ignore
+        if v is None:
+            u, v = u  # type: ignore
+        edge = self.find_edge(u, v)  # type: ignore
+        if edge is None:
+            raise KeyError((u, v))
+        return self.edge[edge[0]][edge[1]].get("interactions", self.default_edge_attributes["interactions"])  # type: ignore
 
     def interactions(self):
         # type: () -> Generator[Interaction]
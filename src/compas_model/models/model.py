@@ -1,13 +1,17 @@
 from collections import OrderedDict
-from collections import deque
+from typing import TYPE_CHECKING
 from typing import Generator  # noqa: F401
 from typing import Type  # noqa: F401
 
 import compas
 import compas.datastructures  # noqa: F401
 import compas.geometry  # noqa: F401
+from compas.data.encoders import cls_from_dtype
 from compas.datastructures import Datastructure
+from compas.geometry import Box
 from compas.geometry import Frame
+from compas.geometry import Transformation
+from compas.geometry import oriented_bounding_box
 
 from compas_model.elements import Element  # noqa: F401
 from compas_model.interactions import Interaction  # noqa: F401
@@ -18,11 +22,49 @@ from .elementtree import ElementTree
 from .groupnode import GroupNode
 from .interactiongraph import InteractionGraph
 
+if TYPE_CHECKING:
+    import numpy  # noqa: F401
+
 
 class ModelError(Exception):
     pass
 
 
+def _frames_to_numpy(frames):
+    # type: (list[compas.geometry.Frame]) -> numpy.ndarray
+    # the transformations from the world coordinate system to a list of frames
+    # as an array of shape (n, 4, 4)
+    from numpy import eye
+    from numpy import tile
+
+    matrices = tile(eye(4), (len(frames), 1, 1))
+    matrices[:, :3, 0] = [frame.xaxis for frame in frames]
+    matrices[:, :3, 1] = [frame.yaxis for frame in frames]
+    matrices[:, :3, 2] = [frame.zaxis for frame in frames]
+    matrices[:, :3, 3] = [frame.point for frame in frames]
+    return matrices
+
+
+def _oriented_bounding_boxes_task(points):
+    # type: (list[numpy.ndarray]) -> list[list[list[float]]]
+    return [oriented_bounding_box(xyz.tolist()) for xyz in points]
+
+
+def _oriented_bounding_boxes(points, indices, workers=None, chunksize=64):
+    # type: (list[numpy.ndarray], list[int], int | None, int) -> list[compas.geometry.Box]
+    # the minimum volume boxes of a selection of point sets
+    # optionally computed in chunks in a pool of worker processes
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunks = [[points[i] for i in indices[start : start + chunksize]] for start in range(0, len(indices), chunksize)]
+    if workers and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_oriented_bounding_boxes_task, chunks))
+    else:
+        results = [_oriented_bounding_boxes_task(chunk) for chunk in chunks]
+    return [Box.from_bounding_box(corners) for result in results for corners in result]
+
+
 class Model(Datastructure):
     """Class representing a general model of hierarchically organised elements, with interactions.
 
@@ -54,12 +96,29 @@ class Model(Datastructure):
         # the element tree and the interaction graph
         # refer to model elements by their GUID, to avoid storing duplicate data representations of those elements
         # the elements are stored in a global list
+        # shapes that are shared by multiple elements are stored only once,
+        # and the elements referring to them are stored as instances with a reference to the GUID of their shape
+        # the shapes added to the model explicitly are stored separately from the shapes that are only shared implicitly
+        shapes = self._shared_shapes()
+        elements = []
+        for element in self.elements():
+            shape = getattr(element, "shape", None)
+            if shape is not None and str(shape.guid) in shapes:
+                elementdata = element.__data__
+                if elementdata.get("shape") is shape:
+                    elementdata["shape"] = str(shape.guid)
+                    elements.append({"type": element.__dtype__, "data": elementdata, "guid": str(element.guid)})
+                    continue
+            elements.append(element)
+
         data = {
             "tree": self._tree.__data__,
             "graph": self._graph.__data__,
-            "elements": list(self.elements()),
+            "elements": elements,
             "materials": list(self.materials()),
             "element_material": {str(element.guid): str(element.material.guid) for element in self.elements() if element.material},
+            "shapes": OrderedDict((guid, shape) for guid, shape in shapes.items() if guid in self._guid_shape),
+            "shared_shapes": OrderedDict((guid, shape) for guid, shape in shapes.items() if guid not in self._guid_shape),
         }
         return data
 
@@ -67,7 +126,17 @@ class Model(Datastructure):
     def __from_data__(cls, data):
         model = cls()
         model._guid_material = {str(material.guid): material for material in data["materials"]}
-        model._guid_element = {str(element.guid): element for element in data["elements"]}
+        model._guid_shape = OrderedDict(data.get("shapes", {}))
+        shapes = dict(model._guid_shape)
+        shapes.update(data.get("shared_shapes", {}))
+
+        for element in data["elements"]:
+            if isinstance(element, dict):
+                # an instance of a shared shape
+                elementdata = dict(element["data"])
+                elementdata["shape"] = shapes[elementdata["shape"]]
+                element = cls_from_dtype(element["type"]).__jsonload__(elementdata, guid=element["guid"])
+            model._guid_element[str(element.guid)] = element
 
         for e, m in data["element_material"].items():
             element = model._guid_element[e]
@@ -119,6 +188,7 @@ class Model(Datastructure):
         self._frame = None
         self._guid_material = {}
         self._guid_element = OrderedDict()
+        self._guid_shape = OrderedDict()
         self._tree = ElementTree(model=self)
         self._graph = InteractionGraph()
         self._graph.update_default_node_attributes(element=None)
@@ -167,8 +237,8 @@ class Model(Datastructure):
     # The elements in the model can define their own frame wrt the coordinate system of the model.
     # The hierarchy of transformations is defined through the element tree.
     # Each element can compute its own world coordinates by traversing the element tree.
-    # Alternatively (and this might be faster),
-    # the model can compute the transformations of all of the elements in the tree.
+    # Alternatively (and this is faster for large models),
+    # the model can compute the transformations of all of the elements in the tree (see compute_worldtransformations).
 
     @property
     def frame(self):
@@ -224,6 +294,23 @@ class Model(Datastructure):
         guid = str(element.guid)
         return guid in self._guid_element
 
+    def has_shape(self, shape):
+        # type: (compas.datastructures.Mesh) -> bool
+        """Returns True if the model contains the given shared shape.
+
+        Parameters
+        ----------
+        shape : :class:`compas.datastructures.Mesh`
+            The shape to check.
+
+        Returns
+        -------
+        bool
+
+        """
+        guid = str(shape.guid)
+        return guid in self._guid_shape
+
     def has_interaction(self, a, b):
         # type: (Element, Element) -> bool
         """Returns True if two elements have an interaction set between them.
@@ -240,12 +327,7 @@ class Model(Datastructure):
         bool
 
         """
-        edge = a.graph_node, b.graph_node
-        result = self.graph.has_edge(edge)
-        if not result:
-            edge = b.graph_node, a.graph_node
-            result = self.graph.has_edge(edge)
-        return result
+        return self.graph.find_edge(a.graph_node, b.graph_node) is not None
 
     def has_material(self, material):
         # type: (Material) -> bool
@@ -316,8 +398,8 @@ class Model(Datastructure):
 
         return element_node
 
-    def add_elements(self, elements, parent=None):
-        # type: (list[Element], GroupNode | None) -> list[ElementNode]
+    def add_elements(self, elements, parent=None, material=None):
+        # type: (list[Element], GroupNode | None, Material | None) -> list[ElementNode]
         """Add multiple elements to the model.
 
         Parameters
@@ -327,16 +409,54 @@ class Model(Datastructure):
         parent : :class:`GroupNode`, optional
             The parent group node of the elements.
             If ``None``, the elements will be added directly under the root node.
+        material : :class:`Material`, optional
+            A material to assign to all elements.
+            Note that the material should have already been added to the model before it can be assigned.
 
         Returns
         -------
         list[:class:`ElementNode`]
 
+        Raises
+        ------
+        ValueError
+            If the parent node is not a GroupNode.
+        ValueError
+            If a material is provided that is not part of the model.
+
+        Notes
+        -----
+        All inputs are validated before the model is modified.
+        The graph nodes of the elements are added with identifiers from one contiguous range,
+        and the tree nodes are added to the parent group in one batch.
+
         """
-        nodes = []
-        for element in elements:
-            nodes.append(self.add_element(element, parent=parent))
-        return nodes
+        elements = list(elements)
+        guids = [str(element.guid) for element in elements]
+        if len(set(guids)) != len(guids) or any(guid in self._guid_element for guid in guids):
+            raise Exception("Element already in the model.")
+
+        if not parent:
+            parent = self._tree.root  # type: ignore
+
+        if not isinstance(parent, GroupNode):
+            raise ValueError("Parent should be a GroupNode.")
+
+        if material and not self.has_material(material):
+            raise ValueError("The material is not part of the model: {}".format(material))
+
+        for guid, element, node in zip(guids, elements, self.graph.add_element_nodes(elements)):
+            self._guid_element[guid] = element
+            element.graph_node = node
+
+        element_nodes = [ElementNode(element=element) for element in elements]
+        parent.add_nodes(element_nodes)
+
+        if material:
+            for element in elements:
+                element._material = material
+
+        return element_nodes
 
     def add_group(self, name, parent=None, attr=None, **kwargs):
         # type: (str, GroupNode | None, dict | None, dict) -> GroupNode
@@ -392,6 +512,39 @@ class Model(Datastructure):
         # check if a similar material is already in the model
         self._guid_material[guid] = material
 
+    def add_shape(self, shape):
+        # type: (compas.datastructures.Mesh) -> compas.datastructures.Mesh
+        """Add a shape to the model that can be shared by multiple elements.
+
+        Parameters
+        ----------
+        shape : :class:`compas.datastructures.Mesh`
+            The shape, in the local coordinates of the elements using it.
+
+        Returns
+        -------
+        :class:`compas.datastructures.Mesh`
+            The shape.
+
+        Notes
+        -----
+        Elements that are constructed with the same shape object are instances of that shape,
+        and only differ in their frame and transformation.
+        The shape itself is never modified by the elements,
+        and the world geometry of every instance is computed only when it is needed.
+        A shared shape is serialised only once in the data representation of the model,
+        even if it is not added to the model explicitly.
+
+        Note that :class:`compas_model.elements.BlockElement` only shares shapes of type :class:`compas_model.elements.BlockGeometry`.
+        Other meshes are copied when the element is created.
+
+        """
+        guid = str(shape.guid)
+        if guid in self._guid_shape:
+            raise Exception("Shape already in the model.")
+        self._guid_shape[guid] = shape
+        return shape
+
     def add_interaction(self, a, b, interaction=None):
         # type: (Element, Element, Interaction | None) -> tuple[int, int]
         """Add an interaction between two elements of the model.
@@ -415,6 +568,11 @@ class Model(Datastructure):
         Exception
             If one or both of the elements are not in the graph.
 
+        Notes
+        -----
+        If the elements already have an interaction,
+        the new interaction is added to the existing edge, regardless of its direction.
+
         """
         if not self.has_element(a) or not self.has_element(b):
             raise Exception("Please add both elements to the model first.")
@@ -425,14 +583,48 @@ class Model(Datastructure):
         if not self.graph.has_node(node_a) or not self.graph.has_node(node_b):
             raise Exception("Something went wrong: the elements are not in the interaction graph.")
 
-        edge = self._graph.add_edge(node_a, node_b)
+        return self.graph.add_edge_interactions(node_a, node_b, [interaction] if interaction else None)
 
-        if interaction:
-            interactions = self.graph.edge_interactions(edge) or []
-            interactions.append(interaction)
-            self.graph.edge_attribute(edge, name="interactions", value=interactions)
+    def add_interactions(self, pairs_with_interactions):
+        # type: (list[tuple[Element, Element, Interaction | list[Interaction] | None]]) -> list[tuple[int, int]]
+        """Add interactions between multiple pairs of elements of the model.
+
+        Parameters
+        ----------
+        pairs_with_interactions : list[tuple[:class:`Element`, :class:`Element`, :class:`Interaction` | list[:class:`Interaction`] | None]]
+            The pairs of elements, each with an interaction, a list of interactions, or None.
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            The edges of the interaction graph representing the interactions between the pairs of elements.
+
+        Raises
+        ------
+        Exception
+            If one or more of the elements are not in the model.
+
+        Notes
+        -----
+        All elements are validated before the interaction graph is modified.
+        The direction of the pairs is irrelevant.
+        The interactions of a pair are added to the existing edge between its elements,
+        regardless of the direction in which that edge is stored.
 
-        return edge
+        """
+        pairs_with_interactions = list(pairs_with_interactions)
+
+        nodes = self._graph.node
+        for a, b, _ in pairs_with_interactions:
+            if str(a.guid) not in self._guid_element or str(b.guid) not in self._guid_element:
+                raise Exception("Please add both elements to the model first.")
+            if a.graph_node not in nodes or b.graph_node not in nodes:
+                raise Exception("Something went wrong: the elements are not in the interaction graph.")
+
+        return self._graph.add_edges_interactions(
+            (a.graph_node, b.graph_node, interactions if interactions is None or isinstance(interactions, (list, tuple)) else [interactions])
+            for a, b, interactions in pairs_with_interactions
+        )
 
     def remove_element(self, element):
         # type: (Element) -> None
@@ -454,7 +646,9 @@ class Model(Datastructure):
         del self._guid_element[guid]
 
         self.graph.delete_node(element.graph_node)
+        self.tree.invalidate(element.tree_node)
         self.tree.remove(element.tree_node)
+        self.tree.unmark_modified(element)
 
     def remove_interaction(self, a, b, interaction: Interaction = None):
         # type: (Element, Element, Interaction) -> None
@@ -474,15 +668,9 @@ class Model(Datastructure):
         if interaction:
             raise NotImplementedError
 
-        edge = a.graph_node, b.graph_node
-        if self.graph.has_edge(edge):
+        edge = self.graph.find_edge(a.graph_node, b.graph_node)
+        if edge:
             self.graph.delete_edge(edge)
-            return
-
-        edge = b.graph_node, a.graph_node
-        if self.graph.has_edge(edge):
-            self.graph.delete_edge(edge)
-            return
 
     def assign_material(self, material, element=None, elements=None):
         # type: (Material, Element | None, list[Element] | None) -> None
@@ -529,6 +717,205 @@ class Model(Datastructure):
             for element in elements:
                 element._material = material
 
+    def compute_worldtransformations(self):
+        # type: () -> None
+        """Compute the world transformations of all elements in a single traversal of the element tree.
+
+        Returns
+        -------
+        None
+            The world transformations are stored in the caches of the elements.
+
+        Notes
+        -----
+        The cumulative transformation of every group is computed only once,
+        instead of once per descendant element as in :meth:`Element.compute_worldtransformation`.
+        The transformations of all elements are then computed with batched matrix products
+        of the transformations of their parent groups, their frames, and their transformations.
+
+        """
+        from numpy import array
+        from numpy import eye
+        from numpy import matmul
+        from numpy import tile
+
+        groups = []  # type: list[numpy.ndarray]
+        parents = []  # type: list[int]
+        elements = []  # type: list[Element]
+
+        # top-down traversal of the tree
+        # with the index of the cumulative transformation of the parent group of every node
+        stack = [(self._tree.root, eye(4))]
+        while stack:
+            node, matrix = stack.pop()
+            if node.frame:
+                matrix = matrix.dot(_frames_to_numpy([node.frame])[0])
+            index = len(groups)
+            groups.append(matrix)
+            for child in node.children:
+                if isinstance(child, ElementNode):
+                    elements.append(child.element)
+                    parents.append(index)
+                else:
+                    stack.append((child, matrix))
+
+        if not elements:
+            return
+
+        frames = tile(eye(4), (len(elements), 1, 1))
+        framed = [index for index, element in enumerate(elements) if element.frame]
+        if framed:
+            frames[framed] = _frames_to_numpy([elements[index].frame for index in framed])
+
+        transformations = tile(eye(4), (len(elements), 1, 1))
+        transformed = [index for index, element in enumerate(elements) if element.transformation]
+        if transformed:
+            transformations[transformed] = array([elements[index].transformation.matrix for index in transformed], dtype=float)
+
+        matrices = matmul(matmul(array(groups)[parents], frames), transformations)
+
+        for element, matrix in zip(elements, matrices.tolist()):
+            element._worldtransformation = Transformation(matrix)
+
+    def compute_aabbs(self):
+        # type: () -> None
+        """Compute the Axis Aligned Bounding Boxes (AABB) of all elements at once.
+
+        Returns
+        -------
+        None
+            The boxes are stored in the caches of the elements.
+
+        Notes
+        -----
+        The world vertices of all elements are packed in a single buffer,
+        and the bounds of all elements are computed with one reduction over that buffer.
+        Elements without vertices are skipped.
+
+        """
+        from numpy import maximum
+        from numpy import minimum
+
+        elements, vertices, offsets = self._packed_worldvertices()
+        if not elements:
+            return
+
+        mins = minimum.reduceat(vertices, offsets, axis=0)
+        maxs = maximum.reduceat(vertices, offsets, axis=0)
+        centers = 0.5 * (mins + maxs)
+        sizes = maxs - mins
+
+        for element, center, (xsize, ysize, zsize) in zip(elements, centers.tolist(), sizes.tolist()):
+            element._aabb = Box(xsize, ysize, zsize, frame=Frame(center, [1, 0, 0], [0, 1, 0]))
+
+    def compute_obbs(self, exact=False, tol=1e-2, workers=None, chunksize=64):
+        # type: (bool, float, int | None, int) -> None
+        """Compute the Oriented Bounding Boxes (OBB) of all elements at once.
+
+        Parameters
+        ----------
+        exact : bool, optional
+            If True, compute the minimum volume box of every element,
+            as with :meth:`Element.compute_obb`.
+            If False, use the principal axes of the vertices of the elements if they are well defined.
+        tol : float, optional
+            The relative tolerance for the difference between the principal variances of the vertices of an element.
+            If two variances are closer than this, the principal axes are not well defined,
+            and the minimum volume box is computed instead.
+        workers : int, optional
+            The number of worker processes for computing minimum volume boxes.
+            If None, the boxes are computed in the current process.
+        chunksize : int, optional
+            The number of elements per task of a worker process.
+
+        Returns
+        -------
+        None
+            The boxes are stored in the caches of the elements.
+
+        Notes
+        -----
+        The principal axes of all elements are computed with a batched eigen decomposition
+        of the covariance matrices of their vertices,
+        and the extents along those axes with one reduction over a packed buffer of all vertices.
+        For box-like elements, such as rectangular blocks and plates, the result is the minimum volume box.
+        For other elements, the box contains all vertices, but can be significantly larger than the minimum volume box.
+        For example, for the voussoirs of a cross vault, some boxes are up to twice as large.
+        This is fine for collision culling, but use ``exact=True`` if the boxes should be minimal.
+
+        """
+        from numpy import add
+        from numpy import append
+        from numpy import arange
+        from numpy import diff
+        from numpy import einsum
+        from numpy import maximum
+        from numpy import minimum
+        from numpy import repeat
+        from numpy import split
+        from numpy.linalg import eigh
+
+        elements, vertices, offsets = self._packed_worldvertices()
+        if not elements:
+            return
+
+        counts = diff(append(offsets, len(vertices)))
+        index = repeat(arange(len(elements)), counts)
+
+        means = add.reduceat(vertices, offsets, axis=0) / counts[:, None]
+        centered = vertices - means[index]
+        covariances = add.reduceat(einsum("ij,ik->ijk", centered, centered), offsets, axis=0) / counts[:, None, None]
+        variances, axes = eigh(covariances)
+
+        # the local coordinates of all vertices with respect to the principal axes of their element
+        local = einsum("ij,ijk->ik", centered, axes[index])
+        mins = minimum.reduceat(local, offsets, axis=0)
+        maxs = maximum.reduceat(local, offsets, axis=0)
+        centers = means + einsum("ijk,ik->ij", axes, 0.5 * (mins + maxs))
+        sizes = maxs - mins
+
+        # eigh returns the variances in ascending order
+        scale = variances[:, 2:] + 1e-12
+        degenerate = ((variances[:, 1:] - variances[:, :-1]) < tol * scale).any(axis=1) | (counts < 4)
+
+        fallback = [i for i in range(len(elements)) if exact or degenerate[i]]
+        boxes = dict(zip(fallback, _oriented_bounding_boxes(split(vertices, offsets[1:]), fallback, workers, chunksize)))
+
+        axes = axes.tolist()
+        for i, element in enumerate(elements):
+            if i in boxes:
+                element._obb = boxes[i]
+                continue
+            xaxis = [row[2] for row in axes[i]]
+            yaxis = [row[1] for row in axes[i]]
+            xsize = float(sizes[i, 2])
+            ysize = float(sizes[i, 1])
+            zsize = float(sizes[i, 0])
+            element._obb = Box(xsize, ysize, zsize, frame=Frame(centers[i].tolist(), xaxis, yaxis))
+
+    def _packed_worldvertices(self):
+        # type: () -> tuple[list[Element], numpy.ndarray, numpy.ndarray]
+        # the elements with vertices,
+        # the stacked world vertices of those elements,
+        # and the offsets of the vertices of every element in the stack
+        from numpy import concatenate
+        from numpy import cumsum
+
+        elements = []
+        arrays = []
+        for element in self.elements():
+            try:
+                xyz = element.worldvertices
+            except NotImplementedError:
+                continue
+            if len(xyz):
+                elements.append(element)
+                arrays.append(xyz)
+        if not elements:
+            return elements, None, None
+        offsets = cumsum([0] + [len(xyz) for xyz in arrays[:-1]])
+        return elements, concatenate(arrays), offsets
+
     # =============================================================================
     # Accessors
     # =============================================================================
@@ -544,6 +931,38 @@ class Model(Datastructure):
         """
         return iter(self._guid_element.values())
 
+    def modified_elements(self):
+        # type: () -> Generator[Element]
+        """Yield the elements that were added or moved since the last call to :meth:`clear_modified`.
+
+        Yields
+        ------
+        :class:`Element`
+
+        Notes
+        -----
+        Elements are marked as modified when they are added to the model,
+        and when their frame or transformation is changed.
+        Algorithms with an incremental mode, such as :func:`compas_model.algorithms.blockmodel_interfaces`,
+        only recompute the collisions and interactions of these elements.
+        These algorithms never clear the marks themselves,
+        such that several of them can be run on the same modifications.
+        Call :meth:`clear_modified` once all of them are up to date.
+
+        """
+        return iter(self._tree.modified_elements)
+
+    def clear_modified(self):
+        # type: () -> None
+        """Remove the modified mark of all elements.
+
+        Returns
+        -------
+        None
+
+        """
+        self._tree.clear_modified()
+
     def materials(self):
         # type: () -> Generator[Material]
         """Yield all the materials contained in the model.
@@ -555,6 +974,32 @@ class Model(Datastructure):
         """
         return iter(self._guid_material.values())
 
+    def shapes(self):
+        # type: () -> Generator[compas.datastructures.Mesh]
+        """Yield all the shared shapes contained in the model.
+
+        Yields
+        ------
+        :class:`compas.datastructures.Mesh`
+
+        """
+        return iter(self._guid_shape.values())
+
+    def _shared_shapes(self):
+        # type: () -> OrderedDict
+        # the shapes added to the model explicitly,
+        # and the shapes that are used by more than one element
+        shapes = OrderedDict(self._guid_shape)
+        seen = set()
+        for element in self.elements():
+            shape = getattr(element, "shape", None)
+            if shape is None:
+                continue
+            if id(shape) in seen:
+                shapes[str(shape.guid)] = shape
+            seen.add(id(shape))
+        return shapes
+
     def interactions(self):
         # type: () -> Generator[Interaction]
         """Yield all interactions between all elements in the model.
@@ -579,31 +1024,11 @@ class Model(Datastructure):
         -------
         list[list[:class:`compas_model.elements.Element`]]
 
-        """
+        Notes
+        -----
+        The groups are computed from an index of the edges of the interaction graph by interaction type,
+        and are cached by the graph until its edges or their interactions change.
+        See :meth:`InteractionGraph.connected_components`.
 
-        def bfs(adjacency, root):
-            tovisit = deque([root])
-            visited = set([root])
-            while tovisit:
-                node = tovisit.popleft()
-                for nbr in adjacency[node]:
-                    if nbr not in visited:
-                        if self.graph.has_edge((node, nbr)):
-                            edge = node, nbr
-                        else:
-                            edge = nbr, node
-                        interactions = self.graph.edge_interactions(edge)
-                        if any(isinstance(interaction, interaction_type) for interaction in interactions):
-                            tovisit.append(nbr)
-                            visited.add(nbr)
-            return visited
-
-        tovisit = set(self.graph.adjacency)
-        components = []
-        while tovisit:
-            root = tovisit.pop()
-            visited = bfs(self.graph.adjacency, root)
-            tovisit -= visited
-            if len(visited) > 1:
-                components.append(visited)
-        return components
+        """
+        return [[self.graph.node_element(node) for node in component] for component in self.graph.connected_components(interaction_type)]
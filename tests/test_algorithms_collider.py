@@ -1,6 +1,10 @@
-from compas.geometry import Box, Frame, Polygon
+import random
+
+from compas.geometry import Box, Frame, Polygon, Rotation, Translation
 from compas.datastructures import Mesh
 from compas_model.algorithms import collisions
+from compas_model.elements import BlockElement
+from compas_model.models import Model
 
 
 def test_is_aabb_aabb_collision():
@@ -72,6 +76,169 @@ def test_is_face_to_face_collision():
     result = collisions.is_face_to_face_collision(polygons0, polygons1, None, None, 0.01, 0.01, True)
     assert result[0][0] == (2, 4)
 
+    frames0 = collisions._polygon_frames(polygons0)
+    frames1 = collisions._polygon_frames(polygons1)
+    cache = {}
+    first = collisions.is_face_to_face_collision(polygons0, polygons1, frames0, frames1, 0.01, 0.01, cache=cache)
+    size = len(cache)
+    second = collisions.is_face_to_face_collision(polygons0, polygons1, frames0, frames1, 0.01, 0.01, cache=cache)
+    assert size > 0
+    assert len(cache) == size
+    assert [faces for faces, _ in first] == [faces for faces, _ in second] == [faces for faces, _ in result]
+
+
+def test_get_aabb_collision_pairs_sap_matches_bruteforce():
+    random.seed(0)
+    boxes = []
+    for _ in range(60):
+        point = [random.uniform(0, 10), random.uniform(0, 10), random.uniform(0, 10)]
+        frame = Frame(point, [1, 0, 0], [0, 1, 0])
+        boxes.append(Box(frame=frame, xsize=random.uniform(0.5, 2), ysize=random.uniform(0.5, 2), zsize=random.uniform(0.5, 2)))
+    # add two exactly touching boxes
+    boxes.append(Box(frame=Frame([20, 0, 0], [1, 0, 0], [0, 1, 0]), xsize=1, ysize=1, zsize=1))
+    boxes.append(Box(frame=Frame([21, 0, 0], [1, 0, 0], [0, 1, 0]), xsize=1, ysize=1, zsize=1))
+
+    expected = collisions.get_aabb_collision_pairs(boxes, broadphase="bruteforce")
+    assert (60, 61) in expected
+    assert collisions.get_aabb_collision_pairs(boxes, broadphase="sap") == expected
+    assert collisions.get_aabb_collision_pairs(boxes, broadphase="numpy") == expected
+
+
+def test_get_aabb_collision_pairs_sap_axis():
+    random.seed(2)
+    for axis in range(3):
+        boxes = []
+        for index in range(100):
+            point = [random.uniform(0, 1), random.uniform(0, 1), random.uniform(0, 1)]
+            point[axis] = 0.9 * index
+            frame = Frame(point, [1, 0, 0], [0, 1, 0])
+            boxes.append(Box(frame=frame, xsize=1, ysize=1, zsize=1))
+
+        expected = collisions.get_aabb_collision_pairs(boxes, broadphase="bruteforce")
+        assert (0, 1) in expected
+        assert collisions.get_aabb_collision_pairs(boxes, broadphase="sap") == expected
+
+
+def test_get_aabb_collision_pairs_numpy_tiles():
+    random.seed(1)
+    boxes = []
+    for _ in range(50):
+        point = [random.uniform(0, 5), random.uniform(0, 5), random.uniform(0, 5)]
+        frame = Frame(point, [1, 0, 0], [0, 1, 0])
+        boxes.append(Box(frame=frame, xsize=1, ysize=1, zsize=1))
+
+    aabbs = collisions.aabbs_to_numpy(boxes)
+    assert aabbs.shape == (50, 2, 3)
+
+    expected = collisions.get_aabb_collision_pairs(boxes, broadphase="bruteforce")
+    assert collisions.get_aabb_collision_pairs_numpy(aabbs, tilesize=7) == expected
+
+
+def test_is_box_box_collision_batch():
+    random.seed(2)
+    boxes0 = []
+    boxes1 = []
+    for _ in range(200):
+        for boxes in (boxes0, boxes1):
+            point = [random.uniform(0, 3), random.uniform(0, 3), random.uniform(0, 3)]
+            frame = Frame(point, [random.uniform(-1, 1) for _ in range(3)], [random.uniform(-1, 1) for _ in range(3)])
+            boxes.append(Box(frame=frame, xsize=random.uniform(0.5, 1.5), ysize=random.uniform(0.5, 1.5), zsize=random.uniform(0.5, 1.5)))
+
+    expected = [collisions.is_box_box_collision(box0, box1) for box0, box1 in zip(boxes0, boxes1)]
+    result = collisions.is_box_box_collision_batch(collisions.obbs_to_numpy(boxes0), collisions.obbs_to_numpy(boxes1))
+    assert result.tolist() == expected
+    assert any(expected) and not all(expected)
+
+
+def test_coplanar_frame_candidates():
+    random.seed(3)
+    frames0 = []
+    frames1 = []
+    for _ in range(40):
+        point = [random.uniform(-2, 2) for _ in range(3)]
+        frame = Frame(point, [random.uniform(-1, 1) for _ in range(3)], [random.uniform(-1, 1) for _ in range(3)])
+        frames0.append(frame)
+        # a nearly parallel and nearly coplanar frame, with a random orientation of the normal
+        other = frame.copy()
+        other.point = other.point + other.xaxis * random.uniform(-1, 1) + other.zaxis * random.uniform(-0.1, 0.1)
+        other.xaxis = other.xaxis + other.zaxis * random.uniform(-0.1, 0.1)
+        if random.random() < 0.5:
+            other.yaxis = other.yaxis * -1
+        frames1.append(other)
+
+    candidates = collisions._coplanar_frame_candidates(frames0, frames1)
+    count = 0
+    for i, frame0 in enumerate(frames0):
+        for j, frame1 in enumerate(frames1):
+            if collisions._is_parallel_and_coplanar(frame0, frame1):
+                count += 1
+                assert j in candidates[i]
+    assert count >= 10
+    assert sum(len(c) for c in candidates) < len(frames0) * len(frames1) / 4
+
+
+def _make_block_model():
+    model = Model()
+    for i in range(3):
+        for k in range(2):
+            box = Box(frame=Frame([i, 0, k], [1, 0, 0], [0, 1, 0]), xsize=1, ysize=1, zsize=1)
+            model.add_element(BlockElement.from_box(box))
+    return model
+
+
+def test_get_collision_pairs_parallel():
+    serial = collisions.get_collision_pairs(_make_block_model(), tolerance_area=0.1)
+    parallel = collisions.get_collision_pairs(_make_block_model(), tolerance_area=0.1, workers=2)
+
+    assert len(serial) == 7
+    assert [pair[:2] for pair in parallel] == [pair[:2] for pair in serial]
+    for a, b in zip(serial, parallel):
+        assert [faces for faces, _ in a[2]] == [faces for faces, _ in b[2]]
+        assert [polygon.points for _, polygon in a[2]] == [polygon.points for _, polygon in b[2]]
+
+
+def test_get_collision_pairs_parallel_rotated():
+    # staggered blocks of different sizes in a rotated frame,
+    # such that the interface polygons depend on the exact face frames
+    rotation = Rotation.from_axis_and_angle([1, 2, 3], 0.3)
+
+    def make_model():
+        model = Model()
+        for i in range(3):
+            for k in range(2):
+                box = Box(frame=Frame([i, 0.3 * k, 0.9 * k], [1, 0, 0], [0, 1, 0]), xsize=1, ysize=1 + 0.2 * i, zsize=0.9)
+                model.add_element(BlockElement.from_box(box.transformed(rotation)))
+        return model
+
+    serial = collisions.get_collision_pairs(make_model(), tolerance_area=1e-3)
+    parallel = collisions.get_collision_pairs(make_model(), tolerance_area=1e-3, workers=2)
+
+    assert len(serial) == 7
+    assert [pair[:2] for pair in parallel] == [pair[:2] for pair in serial]
+    for a, b in zip(serial, parallel):
+        assert [faces for faces, _ in a[2]] == [faces for faces, _ in b[2]]
+        assert [polygon.points for _, polygon in a[2]] == [polygon.points for _, polygon in b[2]]
+
+
+def test_get_collision_pairs_inflation():
+    model = Model()
+    for x in (0, 1.004):
+        box = Box(frame=Frame([x, 0, 0], [1, 0, 0], [0, 1, 0]), xsize=1, ysize=1, zsize=1)
+        model.add_element(BlockElement.from_box(box))
+    a, b = model.elements()
+
+    assert collisions.get_collision_pairs(model, aabb_and_obb_inflation=0.01, face_to_face=False) == [[0, 1]]
+    assert collisions.get_collision_pairs(model, aabb_and_obb_inflation=0.0, face_to_face=False) == []
+
+    aabb = a.aabb
+    assert a.get_aabb(0.01).xsize == aabb.xsize + 0.01
+    assert a.get_aabb() is aabb
+    assert a.aabb is aabb
+
+    model.clear_modified()
+    b.transformation = Translation.from_vector([-0.01, 0, 0])
+    assert collisions.get_collision_pairs(model, aabb_and_obb_inflation=0.0, face_to_face=False, incremental=True) == [[0, 1]]
+
 
 if __name__ == "__main__":
     test_is_aabb_aabb_collision()
@@ -81,4 +248,12 @@ if __name__ == "__main__":
     test_is_box_box_collision_rotated()
     test_is_box_box_collision_inside()
     test_is_face_to_face_collision()
+    test_get_aabb_collision_pairs_sap_matches_bruteforce()
+    test_get_aabb_collision_pairs_sap_axis()
+    test_get_aabb_collision_pairs_numpy_tiles()
+    test_is_box_box_collision_batch()
+    test_coplanar_frame_candidates()
+    test_get_collision_pairs_parallel()
+    test_get_collision_pairs_parallel_rotated()
+    test_get_collision_pairs_inflation()
     print("All tests passed!")
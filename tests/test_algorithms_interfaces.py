@@ -0,0 +1,214 @@
+import pytest
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import Translation
+
+from compas_model.algorithms import blockmodel_interfaces
+from compas_model.algorithms import get_collision_pairs
+from compas_model.algorithms.interfaces import merge_coplanar_interfaces
+from compas_model.algorithms.interfaces import mesh_mesh_interfaces
+from compas_model.elements import BlockElement
+from compas_model.interactions import ContactInterface
+from compas_model.models import Model
+
+
+def make_model():
+    model = Model()
+    for i in range(3):
+        box = Box(frame=Frame([i, 0, 0], [1, 0, 0], [0, 1, 0]), xsize=1, ysize=1, zsize=1)
+        model.add_element(BlockElement.from_box(box))
+    return model
+
+
+def test_mesh_mesh_interfaces():
+    a = BlockElement.from_box(Box(frame=Frame([0, 0, 0], [1, 0, 0], [0, 1, 0]), xsize=1, ysize=1, zsize=1))
+    b = BlockElement.from_box(Box(frame=Frame([0.5, 0.5, 1], [1, 0, 0], [0, 1, 0]), xsize=1, ysize=1, zsize=1))
+
+    interfaces = mesh_mesh_interfaces(a.shape, b.shape, tmax=1e-6, amin=1e-2)
+
+    assert len(interfaces) == 1
+    interface = interfaces[0]
+    assert abs(interface.size - 0.25) < 1e-9
+    assert all(abs(point[2] - 0.5) < 1e-9 for point in interface.points)
+    assert abs(abs(interface.frame.zaxis[2]) - 1) < 1e-9
+
+
+def test_blockmodel_interfaces():
+    model = make_model()
+    blockmodel_interfaces(model, nmax=3, tmax=1e-3, amin=1e-2)
+
+    a, b, c = model.elements()
+    assert model.graph.number_of_edges() == 2
+    assert model.has_interaction(a, b)
+    assert model.has_interaction(b, c)
+    assert not model.has_interaction(a, c)
+    # the modified marks are left for the caller to clear
+    assert list(model.modified_elements()) == [a, b, c]
+
+
+def test_blockmodel_interfaces_radius():
+    model = make_model()
+    blockmodel_interfaces(model, tmax=1e-3, amin=1e-2, radius=1.5)
+
+    a, b, c = model.elements()
+    assert model.graph.number_of_edges() == 2
+    assert model.has_interaction(a, b)
+    assert model.has_interaction(b, c)
+
+
+def test_blockmodel_interfaces_aabb():
+    model = make_model()
+    # a large block on top of the row of small blocks
+    top = BlockElement.from_box(Box(frame=Frame([1, 0, 1], [1, 0, 0], [0, 1, 0]), xsize=3, ysize=1, zsize=1))
+    model.add_element(top)
+    blockmodel_interfaces(model, tmax=1e-3, amin=1e-2, neighbours="aabb")
+
+    a, b, c, d = model.elements()
+    assert model.graph.number_of_edges() == 5
+    assert model.has_interaction(a, d)
+    assert model.has_interaction(b, d)
+    assert model.has_interaction(c, d)
+
+
+def test_blockmodel_interfaces_parallel():
+    serial = make_model()
+    blockmodel_interfaces(serial, nmax=3, tmax=1e-3, amin=1e-2)
+    parallel = make_model()
+    blockmodel_interfaces(parallel, nmax=3, tmax=1e-3, amin=1e-2, workers=2)
+
+    assert list(parallel.graph.edges()) == list(serial.graph.edges())
+    for edge in serial.graph.edges():
+        a = serial.graph.edge_interactions(edge)
+        b = parallel.graph.edge_interactions(edge)
+        assert [interface.size for interface in a] == [interface.size for interface in b]
+        assert [interface.points for interface in a] == [interface.points for interface in b]
+
+
+def test_blockmodel_interfaces_incremental():
+    model = make_model()
+    blockmodel_interfaces(model, nmax=3, tmax=1e-3, amin=1e-2)
+    model.clear_modified()
+
+    a, b, c = model.elements()
+    interactions = model.graph.edge_interactions((a.graph_node, b.graph_node))
+
+    c.transformation = Translation.from_vector([2, 0, 0])
+    assert list(model.modified_elements()) == [c]
+
+    blockmodel_interfaces(model, tmax=1e-3, amin=1e-2, incremental=True)
+
+    assert model.graph.number_of_edges() == 1
+    assert model.has_interaction(a, b)
+    assert not model.has_interaction(b, c)
+    # untouched edges are not recomputed
+    assert model.graph.edge_interactions((a.graph_node, b.graph_node)) is interactions
+    assert list(model.modified_elements()) == [c]
+    model.clear_modified()
+
+    d = BlockElement.from_box(Box(frame=Frame([5, 0, 0], [1, 0, 0], [0, 1, 0]), xsize=1, ysize=1, zsize=1))
+    model.add_element(d)
+    blockmodel_interfaces(model, tmax=1e-3, amin=1e-2, incremental=True)
+
+    assert model.graph.number_of_edges() == 2
+    assert model.has_interaction(c, d)
+
+
+def test_get_collision_pairs_incremental():
+    model = make_model()
+    a, b, c = model.elements()
+    model.clear_modified()
+
+    assert get_collision_pairs(model, tolerance_area=0.1, incremental=True) == []
+
+    c.transformation = Translation.from_vector([0, 0, 0.5])
+    pairs = get_collision_pairs(model, tolerance_area=0.1, incremental=True)
+    assert [pair[:2] for pair in pairs] == [[1, 2]]
+
+
+def test_incremental_collisions_and_interfaces():
+    model = make_model()
+    blockmodel_interfaces(model, nmax=3, tmax=1e-3, amin=1e-2)
+    model.clear_modified()
+
+    a, b, c = model.elements()
+
+    # both incremental algorithms see the same modifications
+    c.transformation = Translation.from_vector([2, 0, 0])
+    assert get_collision_pairs(model, tolerance_area=0.1, incremental=True) == []
+    assert list(model.modified_elements()) == [c]
+
+    blockmodel_interfaces(model, tmax=1e-3, amin=1e-2, incremental=True)
+    assert model.graph.number_of_edges() == 1
+    assert not model.has_interaction(b, c)
+    assert list(model.modified_elements()) == [c]
+
+    model.clear_modified()
+
+    # moving a block again only involves that block
+    a.transformation = Translation.from_vector([0, 0, 0.5])
+    assert list(model.modified_elements()) == [a]
+    pairs = get_collision_pairs(model, tolerance_area=0.1, incremental=True)
+    assert [pair[:2] for pair in pairs] == [[0, 1]]
+
+    blockmodel_interfaces(model, tmax=1e-3, amin=1e-2, incremental=True)
+    assert model.graph.number_of_edges() == 1
+    assert model.has_interaction(a, b)
+    assert list(model.modified_elements()) == [a]
+
+
+def make_split_interfaces_model():
+    model = make_model()
+    blockmodel_interfaces(model, nmax=3, tmax=1e-3, amin=1e-2)
+
+    a, b, c = model.elements()
+    edge = a.graph_node, b.graph_node
+    if not model.graph.has_edge(edge):
+        edge = edge[1], edge[0]
+
+    halves = [
+        [[0.5, -0.5, -0.5], [0.5, 0.0, -0.5], [0.5, 0.0, 0.5], [0.5, -0.5, 0.5]],
+        [[0.5, 0.0, -0.5], [0.5, 0.5, -0.5], [0.5, 0.5, 0.5], [0.5, 0.0, 0.5]],
+        [[0.5, 1.0, -0.5], [0.5, 1.5, -0.5], [0.5, 1.5, 0.5], [0.5, 1.0, 0.5]],
+    ]
+    interfaces = [ContactInterface(points=points, frame=Frame.from_points(*points[:3]), size=0.5) for points in halves]
+    model.graph.edge_attribute(edge, "interactions", interfaces)
+    return model, edge
+
+
+def test_merge_coplanar_interfaces():
+    for method in ("mesh", "union", "coverage"):
+        model, edge = make_split_interfaces_model()
+
+        merge_coplanar_interfaces(model, method=method)
+
+        interfaces = model.graph.edge_attribute(edge, "interactions")
+        assert len(interfaces) == 2
+        assert sorted(round(interface.size, 9) for interface in interfaces) == [0.5, 1.0]
+
+        merged = [interface for interface in interfaces if abs(interface.size - 1.0) < 1e-9][0]
+        assert len(merged.points) == 4
+        assert all(abs(point[0] - 0.5) < 1e-9 for point in merged.points)
+
+    with pytest.raises(ValueError):
+        merge_coplanar_interfaces(model, method="other")
+
+
+def test_merge_coplanar_interfaces_holes():
+    for method in ("mesh", "union", "coverage"):
+        model, edge = make_split_interfaces_model()
+
+        # a 4x4 grid of unit squares without one of the inner squares
+        interfaces = []
+        for i in range(4):
+            for j in range(4):
+                if (i, j) == (1, 1):
+                    continue
+                points = [[0.5, i, j], [0.5, i + 1, j], [0.5, i + 1, j + 1], [0.5, i, j + 1]]
+                interfaces.append(ContactInterface(points=points, frame=Frame.from_points(*points[:3]), size=1.0))
+        model.graph.edge_attribute(edge, "interactions", interfaces)
+
+        merge_coplanar_interfaces(model, method=method)
+
+        interfaces = model.graph.edge_attribute(edge, "interactions")
+        assert len(interfaces) == 15
+        assert abs(sum(interface.size for interface in interfaces) - 15) < 1e-9
@@ -0,0 +1,44 @@
+import random
+
+from compas_model.algorithms.nnbrs import find_nearest_neighbours
+from compas_model.algorithms.nnbrs import find_nearest_neighbours_numpy
+from compas_model.algorithms.nnbrs import find_neighbour_pairs_numpy
+from compas_model.algorithms.nnbrs import find_neighbours_in_radius_numpy
+
+
+def make_cloud():
+    random.seed(0)
+    return [[random.uniform(0, 10) for _ in range(3)] for _ in range(100)]
+
+
+def test_find_nearest_neighbours():
+    cloud = make_cloud()
+    distances, indices = find_nearest_neighbours_numpy(cloud, 5)
+
+    assert distances.shape == (100, 5)
+    assert indices.shape == (100, 5)
+    assert indices[:, 0].tolist() == list(range(100))
+
+    nnbrs = find_nearest_neighbours(cloud, 5)
+    assert len(nnbrs) == 100
+    assert nnbrs[3][1] == indices[3].tolist()
+
+    distances, indices = find_nearest_neighbours_numpy(cloud, 1)
+    assert indices.shape == (100, 1)
+
+
+def test_find_neighbours_in_radius():
+    cloud = make_cloud()
+    radius = 1.5
+
+    nbrs = find_neighbours_in_radius_numpy(cloud, radius)
+    pairs = find_neighbour_pairs_numpy(cloud, radius)
+
+    expected = set()
+    for i, a in enumerate(cloud):
+        for j, b in enumerate(cloud):
+            if i < j and sum((x - y) ** 2 for x, y in zip(a, b)) ** 0.5 <= radius:
+                expected.add((i, j))
+
+    assert set(map(tuple, pairs.tolist())) == expected
+    assert set((i, j) for i, js in enumerate(nbrs) for j in js if i < j) == expected
@@ -0,0 +1,82 @@
+from compas.geometry import Box
+from compas.geometry import Translation
+from compas.tolerance import TOL
+
+from compas_model.elements import BlockElement
+from compas_model.elements import BlockGeometry
+
+
+def make_block():
+    return BlockGeometry.from_shape(Box(2, 1, 1))
+
+
+def test_block_facegeometry():
+    block = make_block()
+    facegeometry = block.facegeometry
+
+    assert block.facegeometry is facegeometry
+    assert facegeometry.faces == list(block.faces())
+    assert facegeometry.vertices.shape == (8, 3)
+    assert facegeometry.normals.shape == (6, 3)
+
+    for index, face in enumerate(facegeometry.faces):
+        assert TOL.is_allclose(facegeometry.normals[index].tolist(), block.face_normal(face))
+        assert TOL.is_allclose(facegeometry.centers[index].tolist(), block.face_center(face))
+        assert TOL.is_close(facegeometry.areas[index], block.face_area(face))
+        assert TOL.is_close(facegeometry.offsets[index], sum(x * y for x, y in zip(block.face_normal(face), block.face_center(face))))
+
+    frame = block.frame(facegeometry.faces[0])
+    assert TOL.is_allclose(frame.zaxis, facegeometry.zaxes[0].tolist())
+    assert TOL.is_close(block.volume(), 2.0)
+    assert block.face_normal(block.top())[2] > 0.99
+
+
+def test_block_facegeometry_invalidation():
+    block = make_block()
+    facegeometry = block.facegeometry
+    volume = block.volume()
+
+    block.transform(Translation.from_vector([0, 0, 3]))
+
+    assert block.facegeometry is not facegeometry
+    assert TOL.is_close(block.volume(), volume)
+    assert TOL.is_allclose(block.centroid(), [0, 0, 3])
+    assert TOL.is_allclose(block.facegeometry.vertices.mean(axis=0).tolist(), [0, 0, 3])
+
+    facegeometry = block.facegeometry
+    block.vertex_attribute(0, "z", 10)
+    assert block.facegeometry is not facegeometry
+
+    facegeometry = block.facegeometry
+    block.vertex_attribute(0, "is_support", True)
+    block.frame(facegeometry.faces[0])
+    assert block.facegeometry is facegeometry
+
+    block.vertices_attributes("xyz", [0, 0, 0], keys=[1])
+    assert block.facegeometry is not facegeometry
+
+    facegeometry = block.facegeometry
+    block.flip_cycles()
+    assert block.facegeometry is not facegeometry
+    assert TOL.is_allclose(block.facegeometry.normals.tolist(), [[-x for x in normal] for normal in facegeometry.normals.tolist()])
+
+    facegeometry = block.facegeometry
+    block.delete_face(facegeometry.faces[0])
+    assert len(block.facegeometry.faces) == 5
+
+
+def test_block_element_world_geometry():
+    element = BlockElement(shape=make_block())
+    element.transformation = Translation.from_vector([0, 0, 3])
+
+    local = element.shape.vertices_attributes("xyz")
+    assert TOL.is_allclose(element.geometry.centroid(), [0, 0, 3])
+    assert TOL.is_allclose(element.worldvertices.mean(axis=0).tolist(), [0, 0, 3])
+    assert element.shape.vertices_attributes("xyz") == local
+
+    # invalidating the computed geometry must not apply the transformation twice
+    element.transformation = Translation.from_vector([0, 0, 3])
+    assert TOL.is_allclose(element.geometry.centroid(), [0, 0, 3])
+    assert TOL.is_close(element.aabb.frame.point[2], 3)
+    assert TOL.is_close(element.obb.frame.point[2], 3)
+    assert element.shape.vertices_attributes("xyz") == local
@@ -1,3 +1,4 @@
+import pytest
 from pytest import fixture
 
 from compas_model.models import InteractionGraph
@@ -45,3 +46,108 @@ def test_interaction_deepcopy(mock_graph):
     c_graph = mock_graph.copy()
 
     assert c_graph.number_of_nodes() == 3
+
+
+def test_find_edge(mock_graph):
+    assert mock_graph.find_edge(0, 1) == (0, 1)
+    assert mock_graph.find_edge(1, 0) == (0, 1)
+    assert mock_graph.find_edge(0, 2) is None
+
+    edge = mock_graph.add_edge_interactions(1, 0, [Interaction(name="i_1_0")])
+    assert edge == (0, 1)
+    assert [i.name for i in mock_graph.edge_interactions(edge)] == ["i_0_1", "i_1_0"]
+    assert mock_graph.number_of_edges() == 2
+
+    edge = mock_graph.add_edge_interactions(2, 0, None)
+    assert edge == (2, 0)
+    assert mock_graph.edge_interactions(edge) is None
+    assert mock_graph.find_edge(0, 2) == (2, 0)
+    assert 0 in mock_graph.neighbors(2) and 2 in mock_graph.neighbors(0)
+
+
+def test_edge_index(mock_graph):
+    assert [i.name for i in mock_graph.edge_interactions(1, 0)] == ["i_0_1"]
+    assert [i.name for i in mock_graph.edge_interactions((1, 0))] == ["i_0_1"]
+    assert [i.name for i in mock_graph.edge_interactions(0, 1)] == ["i_0_1"]
+    with pytest.raises(KeyError):
+        mock_graph.edge_interactions(0, 2)
+    assert mock_graph.find_edge(0, None) is None
+    assert mock_graph.find_edge(None, "a") is None
+
+    # an edge stored in both directions
+    mock_graph.add_edge(1, 0, interactions=[Interaction(name="i_1_0")])
+    assert mock_graph.find_edge(1, 0) == (0, 1)
+    mock_graph.delete_edge((0, 1))
+    assert mock_graph.find_edge(0, 1) == (1, 0)
+    mock_graph.delete_edge((1, 0))
+    assert mock_graph.find_edge(0, 1) is None
+
+    mock_graph.add_edge(2, 0)
+    mock_graph.delete_node(2)
+    assert mock_graph.find_edge(0, 2) is None
+    assert mock_graph.find_edge(1, 2) is None
+    assert mock_graph.number_of_edges() == 0
+    assert list(mock_graph.neighbors(1)) == []
+
+    mock_graph.add_edge(0, 1)
+    mock_graph.clear_edges()
+    assert mock_graph.find_edge(0, 1) is None
+    assert mock_graph.number_of_nodes() == 2
+
+
+def test_edge_index_copy(mock_graph):
+    graph = mock_graph.copy()
+    assert graph.find_edge(1, 0) == (0, 1)
+    assert graph.find_edge(2, 1) == (1, 2)
+
+
+class Contact(Interaction):
+    pass
+
+
+def test_connected_components(mock_graph):
+    n_3 = mock_graph.add_node(element=Element(name="e_3"))
+    n_4 = mock_graph.add_node(element=Element(name="e_4"))
+    mock_graph.add_edge(n_3, n_4, interactions=[Contact()])
+    mock_graph.add_edge(n_4, 0)
+
+    assert mock_graph.connected_components(Interaction) == [[0, 1, 2], [3, 4]]
+    assert mock_graph.connected_components(Contact) == [[3, 4]]
+
+    mock_graph.add_edge_interactions(1, 2, [Contact()])
+    assert mock_graph.connected_components(Contact) == [[1, 2], [3, 4]]
+
+    mock_graph.edge_attribute((0, 1), "interactions", [Contact()])
+    assert mock_graph.connected_components(Contact) == [[0, 1, 2], [3, 4]]
+
+    mock_graph.delete_edge((1, 2))
+    assert mock_graph.connected_components(Contact) == [[0, 1], [3, 4]]
+    assert mock_graph.connected_components(Interaction) == [[0, 1], [3, 4]]
+
+    mock_graph.delete_node(4)
+    assert mock_graph.connected_components(Contact) == [[0, 1]]
+
+    mock_graph.clear_edges()
+    assert mock_graph.connected_components(Interaction) == []
+
+
+def test_add_edges_interactions(mock_graph):
+    components = mock_graph.connected_components(Interaction)
+    assert mock_graph._components
+
+    # no new types on existing edges
+    mock_graph.add_edges_interactions([(1, 0, [Interaction()]), (2, 1, [Interaction()])])
+    assert mock_graph._components
+    assert mock_graph.connected_components(Interaction) == components
+
+    n_3 = mock_graph.add_node(element=Element(name="e_3"))
+    edges = mock_graph.add_edges_interactions([(n_3, 2, [Contact()]), (0, 2, None)])
+    assert edges == [(n_3, 2), (0, 2)]
+    assert not mock_graph._components
+    assert mock_graph.connected_components(Contact) == [[2, 3]]
+    assert mock_graph.connected_components(Interaction) == [[0, 1, 2, 3]]
+    assert sorted(mock_graph.interaction_edges(Contact)) == [(3, 2)]
+
+    mock_graph.delete_edge((n_3, 2))
+    assert mock_graph.interaction_edges(Contact) == []
+    assert mock_graph.connected_components(Interaction) == [[0, 1, 2]]
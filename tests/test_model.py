@@ -1,11 +1,20 @@
+import pytest
 from pytest import fixture
 
 from compas.data import json_dumps
 from compas.data import json_loads
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import Rotation
+from compas.geometry import Translation
+from compas.tolerance import TOL
 
 from compas_model.models import Model
 from compas_model.elements import Element
+from compas_model.elements import BlockElement
+from compas_model.elements import BlockGeometry
 from compas_model.interactions import Interaction
+from compas_model.materials import Material
 
 
 @fixture
@@ -45,3 +54,307 @@ def test_model_deepcopy(mock_model):
     assert c_model.graph is not None
     assert c_model.tree is not None
     assert len(c_model.tree.elements) == 3
+
+
+def test_serialize_model_shared_shapes():
+    model = Model()
+    shape = model.add_shape(BlockGeometry.from_shape(Box(1)))
+    for i in range(3):
+        model.add_element(BlockElement(shape=shape, transformation=Translation.from_vector([i, 0, 0])))
+    model.add_element(BlockElement(shape=BlockGeometry.from_shape(Box(2))))
+
+    data = model.__data__
+    assert list(data["shapes"]) == [str(shape.guid)]
+    assert sum(isinstance(element, dict) for element in data["elements"]) == 3
+
+    guids = [str(e.guid) for e in model.elements()]
+    model = json_loads(json_dumps(model))
+    elements = list(model.elements())
+
+    assert guids == [str(e.guid) for e in elements]
+    assert model.has_shape(elements[0].shape)
+    assert elements[0].shape is elements[1].shape is elements[2].shape
+    assert elements[3].shape is not elements[0].shape
+    assert elements[2].aabb.frame.point[0] == 2
+
+
+def test_serialize_model_implicitly_shared_shapes():
+    model = Model()
+    shape = BlockGeometry.from_shape(Box(1))
+    for i in range(2):
+        model.add_element(BlockElement(shape=shape, transformation=Translation.from_vector([i, 0, 0])))
+
+    data = model.__data__
+    assert list(data["shapes"]) == []
+    assert list(data["shared_shapes"]) == [str(shape.guid)]
+
+    for other in [model.copy(), json_loads(json_dumps(model))]:
+        elements = list(other.elements())
+        assert list(other.shapes()) == []
+        assert not other.has_shape(elements[0].shape)
+        assert elements[0].shape is elements[1].shape
+
+
+def test_compute_worldtransformations():
+    model = Model()
+    outer = model.add_group(name="outer")
+    outer.frame = Frame([1, 0, 0], [0, 1, 0], [-1, 0, 0])
+    inner = model.add_group(name="inner", parent=outer)
+    inner.frame = Frame([0, 2, 0], [1, 0, 0], [0, 0, 1])
+
+    elements = [
+        BlockElement(shape=BlockGeometry.from_shape(Box(1))),
+        BlockElement(shape=BlockGeometry.from_shape(Box(1)), frame=Frame([0, 0, 3], [1, 0, 0], [0, 1, 0])),
+        BlockElement(shape=BlockGeometry.from_shape(Box(1)), transformation=Translation.from_vector([4, 0, 0])),
+    ]
+    model.add_element(elements[0])
+    model.add_element(elements[1], parent=outer)
+    model.add_element(elements[2], parent=inner)
+
+    model.compute_worldtransformations()
+
+    for element in elements:
+        assert element._worldtransformation is not None
+        expected = element.compute_worldtransformation()
+        assert TOL.is_allclose(
+            [x for row in element.worldtransformation.matrix for x in row],
+            [x for row in expected.matrix for x in row],
+        )
+
+
+def test_group_frame_invalidation():
+    model = Model()
+    outer = model.add_group(name="outer")
+    inner = model.add_group(name="inner", parent=outer)
+    a = BlockElement(shape=BlockGeometry.from_shape(Box(1)))
+    b = BlockElement(shape=BlockGeometry.from_shape(Box(1)), transformation=Translation.from_vector([2, 0, 0]))
+    c = BlockElement(shape=BlockGeometry.from_shape(Box(1)), transformation=Translation.from_vector([0, 5, 0]))
+    model.add_element(a, parent=inner)
+    model.add_element(b, parent=inner)
+    model.add_element(c, parent=outer)
+    model.clear_modified()
+
+    assert TOL.is_allclose(a.geometry.centroid(), [0, 0, 0])
+    assert TOL.is_allclose(c.geometry.centroid(), [0, 5, 0])
+    assert TOL.is_close(inner.aabb.xsize, 3)
+    assert TOL.is_close(outer.aabb.ysize, 6)
+
+    inner.frame = Frame([0, 0, 10], [1, 0, 0], [0, 1, 0])
+
+    assert list(model.modified_elements()) == [a, b]
+    assert c._geometry is not None
+    assert TOL.is_allclose(a.geometry.centroid(), [0, 0, 10])
+    assert TOL.is_allclose(b.geometry.centroid(), [2, 0, 10])
+    assert TOL.is_close(inner.aabb.frame.point[2], 10)
+    assert TOL.is_close(outer.aabb.zsize, 11)
+
+    c.transformation = Translation.from_vector([0, -5, 0])
+
+    assert inner._aabb is not None
+    assert outer._aabb is None
+    assert TOL.is_close(outer.aabb.ysize, 6)
+    assert TOL.is_close(outer.aabb.frame.point[1], -2.5)
+
+    model.remove_element(c)
+
+    assert TOL.is_close(outer.aabb.ysize, 1)
+    assert TOL.is_close(outer.aabb.frame.point[1], 0)
+
+
+def test_group_aabb_empty_subgroup():
+    model = Model()
+    group = model.add_group(name="group")
+    sub = model.add_group(name="sub", parent=group)
+    model.add_element(BlockElement(shape=BlockGeometry.from_shape(Box(1))), parent=group)
+    model.add_element(Element(), parent=group)
+
+    assert sub.aabb is None
+    assert TOL.is_close(group.aabb.xmax, 0.5)
+    assert TOL.is_close(model.tree.root.aabb.xmax, 0.5)
+
+    model.add_element(BlockElement(shape=BlockGeometry.from_shape(Box(1)), transformation=Translation.from_vector([10, 0, 0])), parent=sub)
+
+    assert TOL.is_close(sub.aabb.xmax, 10.5)
+    assert TOL.is_close(group.aabb.xmax, 10.5)
+    assert TOL.is_close(model.tree.root.aabb.xmax, 10.5)
+
+
+def test_group_reparent_and_remove():
+    model = Model()
+    g1 = model.add_group(name="g1")
+    g2 = model.add_group(name="g2")
+    g2.frame = Frame([0, 0, 10], [1, 0, 0], [0, 1, 0])
+    sub = model.add_group(name="sub", parent=g1)
+    a = BlockElement(shape=BlockGeometry.from_shape(Box(1)))
+    b = BlockElement(shape=BlockGeometry.from_shape(Box(1)), transformation=Translation.from_vector([10, 0, 0]))
+    model.add_element(a, parent=g1)
+    model.add_element(b, parent=sub)
+    model.add_element(BlockElement(shape=BlockGeometry.from_shape(Box(1))), parent=g2)
+    model.clear_modified()
+
+    assert TOL.is_close(a.aabb.frame.point[2], 0)
+    assert TOL.is_close(g1.aabb.xmax, 10.5)
+    assert TOL.is_close(model.tree.root.aabb.zmin, -0.5)
+
+    g1.remove(sub)
+
+    assert TOL.is_close(g1.aabb.xmax, 0.5)
+    assert TOL.is_close(model.tree.root.aabb.xmax, 0.5)
+    assert list(model.modified_elements()) == []
+
+    g1.remove(a.tree_node)
+    g2.add(a.tree_node)
+
+    assert TOL.is_close(a.aabb.frame.point[2], 10)
+    assert g1.aabb is None
+    assert TOL.is_close(g2.aabb.zmin, 9.5)
+    assert TOL.is_close(model.tree.root.aabb.zmin, 9.5)
+    assert list(model.modified_elements()) == [a]
+
+
+def test_compute_bounding_boxes():
+    model = Model()
+    elements = [
+        BlockElement(shape=BlockGeometry.from_shape(Box(2, 1, 0.5))),
+        BlockElement(shape=BlockGeometry.from_shape(Box(1)), transformation=Rotation.from_axis_and_angle([1, 1, 0], 0.3)),
+        BlockElement(shape=BlockGeometry.from_shape(Box(3, 1, 2)), transformation=Rotation.from_axis_and_angle([0, 1, 1], 0.5, point=[5, 0, 0])),
+    ]
+    for element in elements:
+        model.add_element(element)
+    model.add_element(Element())
+
+    model.compute_aabbs()
+    model.compute_obbs()
+
+    for element in elements:
+        aabb = element.compute_aabb()
+        obb = element.compute_obb()
+        assert TOL.is_allclose(element._aabb.frame.point, aabb.frame.point)
+        assert TOL.is_allclose([element._aabb.xsize, element._aabb.ysize, element._aabb.zsize], [aabb.xsize, aabb.ysize, aabb.zsize])
+        assert TOL.is_allclose(element._obb.frame.point, obb.frame.point)
+        assert TOL.is_close(element._obb.volume, obb.volume)
+
+    model.compute_obbs(exact=True, workers=2, chunksize=1)
+
+    for element in elements:
+        assert TOL.is_close(element._obb.volume, element.compute_obb().volume)
+
+
+def test_elementtree_indexes(mock_model):
+    tree = mock_model.tree
+    a, b, c = mock_model.elements()
+
+    assert tree.elements == [a, b, c]
+    assert [node.element for node in tree.element_nodes()] == [a, b, c]
+    assert [group.name for group in tree.group_nodes()] == ["root", "group_ab"]
+    assert tree.find_element_node(b) is b.tree_node
+
+    group = tree.groups[1]
+    assert tree.find_group_node(str(group.guid)) is group
+
+    mock_model.remove_element(b)
+    assert tree.elements == [a, c]
+    with pytest.raises(ValueError):
+        tree.find_element_node(b)
+
+    subgroup = mock_model.add_group(name="sub", parent=group)
+    d = Element(name="d")
+    mock_model.add_element(d, parent=subgroup)
+    assert tree.find_element_node(d) is d.tree_node
+
+    group.remove(subgroup)
+    assert tree.elements == [a, c]
+    assert [group.name for group in tree.groups] == ["root", "group_ab"]
+
+
+def test_elementtree_indexes_serialization(mock_model):
+    model = json_loads(json_dumps(mock_model))
+    assert [element.name for element in model.tree.elements] == ["a", "b", "c"]
+    assert [group.name for group in model.tree.groups] == ["root", "group_ab"]
+
+
+def test_add_elements():
+    model = Model()
+    material = Material(name="material")
+    model.add_material(material)
+    group = model.add_group(name="group")
+    a = Element(name="a")
+    model.add_element(a)
+
+    elements = [Element(name=str(i)) for i in range(5)]
+    nodes = model.add_elements(elements, parent=group, material=material)
+
+    assert [node.element for node in nodes] == elements
+    assert [element.graph_node for element in elements] == [1, 2, 3, 4, 5]
+    assert all(model.graph.node_element(element.graph_node) is element for element in elements)
+    assert all(element.tree_node.parent is group for element in elements)
+    assert all(element.material is material for element in elements)
+    assert model.tree.elements == [a] + elements
+    assert list(model.modified_elements()) == [a] + elements
+    assert model.graph.add_node() == 6
+
+    with pytest.raises(Exception):
+        model.add_elements([Element(), elements[0]])
+    assert len(list(model.elements())) == 6
+
+    with pytest.raises(ValueError):
+        model.add_elements([Element()], material=Material())
+    assert len(list(model.elements())) == 6
+
+
+def test_add_interactions(mock_model):
+    a, b, c = mock_model.elements()
+    d = Element(name="d")
+    mock_model.add_element(d)
+
+    edges = mock_model.add_interactions(
+        [
+            (c, a, Interaction(name="i_c_a")),
+            (a, b, [Interaction(name="i_a_b_0"), Interaction(name="i_a_b_1")]),
+            (d, a, None),
+        ]
+    )
+
+    assert edges[0] == (a.graph_node, c.graph_node)
+    assert [i.name for i in mock_model.graph.edge_interactions(edges[0])] == ["i_a_c", "i_c_a"]
+    assert len(mock_model.graph.edge_interactions(edges[1])) == 2
+    assert mock_model.has_interaction(a, d)
+    assert mock_model.has_interaction(d, a)
+    assert mock_model.graph.number_of_edges() == 4
+
+    with pytest.raises(Exception):
+        mock_model.add_interactions([(a, b, None), (a, Element(), None)])
+    assert mock_model.graph.number_of_edges() == 4
+
+    mock_model.remove_interaction(c, a)
+    assert not mock_model.has_interaction(a, c)
+
+
+def test_interaction_with_element_outside_model(mock_model):
+    a, b, c = mock_model.elements()
+    d = Element(name="d")
+
+    assert not mock_model.has_interaction(a, d)
+    assert not mock_model.has_interaction(d, a)
+    mock_model.remove_interaction(a, d)
+    assert mock_model.graph.number_of_edges() == 2
+
+    model = json_loads(json_dumps(mock_model))
+    for element in model.elements():
+        model.has_interaction(element, d)
+        model.remove_interaction(d, element)
+
+
+def test_elements_connected_by(mock_model):
+    a, b, c = mock_model.elements()
+    d = Element(name="d")
+    e = Element(name="e")
+    mock_model.add_elements([d, e])
+    mock_model.add_interactions([(d, e, Interaction()), (a, d, None)])
+
+    components = mock_model.elements_connected_by(Interaction)
+    assert sorted(sorted(element.name for element in component) for component in components) == [["a", "b", "c"], ["d", "e"]]
+
+    mock_model.remove_interaction(b, c)
+    components = mock_model.elements_connected_by(Interaction)
+    assert sorted(sorted(element.name for element in component) for component in components) == [["a", "c"], ["d", "e"]]